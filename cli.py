@@ -11,7 +11,7 @@ import click
 from tqdm import tqdm
 
 from config.settings import settings
-from core.database import Database
+from core.database import get_database
 from core.models import CompilationStatus, VideoStatus, Platform, ContentStrategy
 from pipeline import Pipeline
 from services.account_manager import AccountManager
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 def get_pipeline() -> Pipeline:
     """Get pipeline instance."""
     settings.ensure_directories()
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     return Pipeline(db)
 
 
@@ -687,7 +687,7 @@ def account():
 @click.option("--daily-limit", "-l", default=6, help="Daily upload limit")
 def account_add(platform: str, name: str, strategy: str, handle: str, daily_limit: int):
     """Add a new platform account."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     platform_enum = Platform.YOUTUBE if platform == "youtube" else Platform.TIKTOK
@@ -713,7 +713,7 @@ def account_add(platform: str, name: str, strategy: str, handle: str, daily_limi
 @click.option("--all", "show_all", is_flag=True, help="Include inactive accounts")
 def account_list(platform: str, show_all: bool):
     """List all accounts."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     platform_enum = None
@@ -748,7 +748,7 @@ def account_list(platform: str, show_all: bool):
 @click.option("--client-secret", prompt=True, hide_input=True, help="OAuth Client Secret")
 def account_auth(account_id: str, client_id: str, client_secret: str):
     """Set up YouTube OAuth credentials for an account."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     acc = manager.get_account(account_id)
@@ -787,7 +787,7 @@ def account_auth(account_id: str, client_id: str, client_secret: str):
 @click.option("--browser", "-b", default="chrome", type=click.Choice(["chrome", "firefox", "edge"]))
 def account_set_cookies(account_id: str, browser: str):
     """Extract and store TikTok cookies from browser."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     acc = manager.get_account(account_id)
@@ -821,7 +821,7 @@ def account_set_cookies(account_id: str, browser: str):
 @click.argument("account_id")
 def account_deactivate(account_id: str):
     """Deactivate an account."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     if manager.deactivate_account(account_id):
@@ -834,7 +834,7 @@ def account_deactivate(account_id: str):
 @click.argument("account_id")
 def account_activate(account_id: str):
     """Activate a deactivated account."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     if manager.activate_account(account_id):
@@ -852,7 +852,7 @@ def account_delete(account_id: str, confirm: bool):
         click.echo("Run with --confirm to delete the account.")
         return
 
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     if manager.delete_account(account_id):
@@ -879,7 +879,7 @@ def route():
 @click.option("--priority", "-p", default=1, help="Priority (higher = preferred)")
 def route_add(account_id: str, category: str, min_confidence: float, priority: int):
     """Add a routing rule for an account."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     rule = manager.add_routing_rule(
@@ -900,7 +900,7 @@ def route_add(account_id: str, category: str, min_confidence: float, priority: i
 @route.command("list")
 def route_list():
     """List all routing rules."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     rules = db.get_all_routing_rules()
 
     if not rules:
@@ -930,7 +930,7 @@ def route_list():
 @click.argument("rule_id")
 def route_delete(rule_id: str):
     """Delete a routing rule."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     manager = AccountManager(db)
 
     if manager.delete_routing_rule(rule_id):
@@ -954,7 +954,7 @@ def queue():
 @click.option("--platform", "-p", type=click.Choice(["youtube", "tiktok"]), default=None)
 def queue_list(platform: str):
     """List pending uploads."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     router = UploadRouter(db)
 
     platform_enum = None
@@ -969,9 +969,11 @@ def queue_list(platform: str):
 
     click.echo(f"Pending Uploads ({len(uploads)}):\n")
 
+    compilations = db.get_compilations_by_ids([u.compilation_id for u in uploads])
+
     for upload in uploads:
         acc = db.get_account(upload.account_id)
-        comp = db.get_compilation(upload.compilation_id)
+        comp = compilations.get(upload.compilation_id)
 
         click.echo(f"{upload.id}:")
         click.echo(f"  Compilation: {comp.title if comp else upload.compilation_id}")
@@ -986,7 +988,7 @@ def queue_list(platform: str):
 @queue.command("stats")
 def queue_stats():
     """Show upload queue statistics."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     router = UploadRouter(db)
 
     stats = router.get_upload_stats()
@@ -1002,7 +1004,7 @@ def queue_stats():
 @queue.command("retry")
 def queue_retry():
     """Retry failed uploads."""
-    db = Database(settings.DATABASE_PATH)
+    db = get_database(settings.DATABASE_PATH)
     router = UploadRouter(db)
 
     count = router.retry_failed_uploads()
@@ -79,6 +79,7 @@ class Settings:
 
     # Download retry settings
     MAX_DOWNLOAD_RETRIES: int = _get_env_int("MAX_DOWNLOAD_RETRIES", 3)
+    DOWNLOAD_WORKERS: int = _get_env_int("DOWNLOAD_WORKERS", 4)
 
     # OpenAI settings
     OPENAI_MODEL: str = _get_env("OPENAI_MODEL", "gpt-4o-mini")
@@ -128,9 +129,14 @@ class Settings:
     MEGA_RANK_TARGET_DURATION: int = _get_env_int("MEGA_RANK_TARGET_DURATION", 90)
     MEGA_RANK_RECENCY_DAYS: int = _get_env_int("MEGA_RANK_RECENCY_DAYS", 14)
 
+    # Set once ensure_directories has run; the paths are fixed per process
+    _directories_ensured: bool = False
+
     @classmethod
     def ensure_directories(cls) -> None:
-        """Create all required directories if they don't exist."""
+        """Create all required directories if they don't exist (once per process)."""
+        if cls._directories_ensured:
+            return
         cls.DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
         cls.DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
         cls.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -140,6 +146,7 @@ class Settings:
         cls.REDDIT_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
         cls.REDDIT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         cls.BACKGROUNDS_DIR.mkdir(parents=True, exist_ok=True)
+        cls._directories_ensured = True
 
     @classmethod
     def validate_api_keys(cls, require_apify: bool = False, require_openai: bool = False) -> None:
@@ -1,6 +1,8 @@
 """Core models and database for viral-clips-pipeline."""
 
 from .models import Video, Compilation, VideoStatus, CompilationStatus
-from .database import Database
+from .database import Database, get_database
 
-__all__ = ["Video", "Compilation", "VideoStatus", "CompilationStatus", "Database"]
+__all__ = [
+    "Video", "Compilation", "VideoStatus", "CompilationStatus", "Database", "get_database"
+]
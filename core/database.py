@@ -3,32 +3,118 @@ SQLite database layer for viral-clips-pipeline.
 Provides CRUD operations for Video and Compilation models.
 """
 
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
+from dataclasses import fields as dataclass_fields
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Generator
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Generator
 
 from .models import (
     Video, Compilation, VideoStatus, CompilationStatus,
     Account, Upload, RoutingRule, Platform, ContentStrategy, UploadStatus,
-    RedditPost, RedditVideo, RedditPostStatus, RedditVideoStatus
+    RedditPost, RedditVideo, RedditPostStatus, RedditVideoStatus,
+    _json_dumps,
 )
 
 
+# Stored in PRAGMA user_version; bump whenever _init_schema/_migrate_schema change
+SCHEMA_VERSION = 3
+
+# Applied once to every pooled connection when it is opened. page_size only
+# takes effect on a brand-new file, so it must run before journal_mode=WAL.
+CONNECTION_PRAGMAS = """
+    PRAGMA page_size = 8192;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA wal_autocheckpoint = 1000;
+    PRAGMA journal_size_limit = 67108864;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections, opened lazily and reused."""
+
+    def __init__(self, db_path: Path, size: int, read_only: bool = False):
+        """Initialize an empty pool of up to size connections."""
+        self.db_path = db_path
+        self.size = size
+        self.read_only = read_only
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the pipeline pragmas applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(CONNECTION_PRAGMAS)
+        if self.read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening one if the pool isn't full."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                return self._connect()
+
+        # Pool exhausted: wait for another thread to release a connection
+        return self._idle.get()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._opened -= 1
+
+
 class Database:
     """SQLite database manager for the pipeline."""
 
-    def __init__(self, db_path: Path):
-        """Initialize database connection."""
+    def __init__(self, db_path: Path, pool_size: int = 4):
+        """Initialize database connection pools."""
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One dedicated writer avoids 'database is locked' between our own
+        # threads; WAL lets the read-only pool run alongside it
+        self._rw_pool = ConnectionPool(db_path, size=1)
+        self._ro_pool = ConnectionPool(db_path, size=pool_size, read_only=True)
+
+        # Lazily loaded external IDs for the *_id_exists checks, keyed by table
+        self._id_caches: Dict[str, Set[str]] = {}
+        self._id_cache_lock = threading.Lock()
+
         self._init_schema()
 
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for the pooled read-write connection."""
+        conn = self._rw_pool.acquire()
         try:
             yield conn
             conn.commit()
@@ -36,11 +122,31 @@ class Database:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self._rw_pool.release(conn)
+
+    @contextmanager
+    def _get_ro_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for a pooled read-only connection (no commit)."""
+        conn = self._ro_pool.acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._ro_pool.release(conn)
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        self._rw_pool.close()
+        self._ro_pool.close()
 
     def _init_schema(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema, skipping work if already current."""
         with self._get_connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == SCHEMA_VERSION:
+                return
+
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS videos (
                     id TEXT PRIMARY KEY,
@@ -68,7 +174,8 @@ class Database:
                     caption TEXT,
                     error TEXT,
                     retry_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    engagement_score INTEGER GENERATED ALWAYS AS (likes + shares * 2) VIRTUAL
                 );
 
                 CREATE TABLE IF NOT EXISTS compilations (
@@ -173,31 +280,59 @@ class Database:
                     FOREIGN KEY (post_id) REFERENCES reddit_posts(id)
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status);
+                CREATE INDEX IF NOT EXISTS idx_videos_status_created ON videos(status, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_videos_category ON videos(category);
                 CREATE INDEX IF NOT EXISTS idx_videos_tiktok_id ON videos(tiktok_id);
                 CREATE INDEX IF NOT EXISTS idx_videos_compilation_id ON videos(compilation_id);
-                CREATE INDEX IF NOT EXISTS idx_compilations_status ON compilations(status);
+                CREATE INDEX IF NOT EXISTS idx_compilations_status_created ON compilations(status, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_compilations_category ON compilations(category);
                 CREATE INDEX IF NOT EXISTS idx_accounts_platform ON accounts(platform);
                 CREATE INDEX IF NOT EXISTS idx_accounts_active ON accounts(is_active);
-                CREATE INDEX IF NOT EXISTS idx_uploads_status ON uploads(status);
-                CREATE INDEX IF NOT EXISTS idx_uploads_account ON uploads(account_id);
-                CREATE INDEX IF NOT EXISTS idx_uploads_compilation ON uploads(compilation_id);
+                CREATE INDEX IF NOT EXISTS idx_uploads_status_created ON uploads(status, created_at);
+                CREATE INDEX IF NOT EXISTS idx_uploads_account_status ON uploads(account_id, status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_uploads_pending_eta
+                    ON uploads(COALESCE(scheduled_at, created_at)) WHERE status = 'pending';
                 CREATE INDEX IF NOT EXISTS idx_routing_account ON routing_rules(account_id);
-                CREATE INDEX IF NOT EXISTS idx_routing_category ON routing_rules(category);
-                CREATE INDEX IF NOT EXISTS idx_reddit_posts_status ON reddit_posts(status);
+                CREATE INDEX IF NOT EXISTS idx_routing_category_priority ON routing_rules(category, priority DESC);
+                CREATE INDEX IF NOT EXISTS idx_accounts_id_active ON accounts(id, is_active);
+                CREATE INDEX IF NOT EXISTS idx_reddit_posts_status_upvotes ON reddit_posts(status, upvotes DESC);
                 CREATE INDEX IF NOT EXISTS idx_reddit_posts_subreddit ON reddit_posts(subreddit);
                 CREATE INDEX IF NOT EXISTS idx_reddit_posts_reddit_id ON reddit_posts(reddit_id);
-                CREATE INDEX IF NOT EXISTS idx_reddit_videos_status ON reddit_videos(status);
+                CREATE INDEX IF NOT EXISTS idx_reddit_videos_status_created ON reddit_videos(status, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_reddit_videos_post_id ON reddit_videos(post_id);
+
+                -- Superseded by the composite indexes above
+                DROP INDEX IF EXISTS idx_videos_status;
+                DROP INDEX IF EXISTS idx_compilations_status;
+                DROP INDEX IF EXISTS idx_uploads_status;
+                DROP INDEX IF EXISTS idx_uploads_account;
+                DROP INDEX IF EXISTS idx_uploads_compilation;
+                DROP INDEX IF EXISTS idx_routing_category;
+                DROP INDEX IF EXISTS idx_reddit_posts_status;
+                DROP INDEX IF EXISTS idx_reddit_videos_status;
             """)
 
             # Migration: Add new columns to existing tables if they don't exist
             self._migrate_schema(conn)
 
-    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
-        """Add new columns to existing tables for backwards compatibility."""
+            # Refresh planner statistics whenever the schema changes; without
+            # uploads stats the planner ignores the partial pending-ETA index
+            conn.executescript("""
+                ANALYZE videos;
+                ANALYZE compilations;
+                ANALYZE accounts;
+                ANALYZE uploads;
+            """)
+
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> bool:
+        """
+        Add new columns to existing tables for backwards compatibility.
+        Returns True if any column was added.
+        """
+        migrated = False
+
         # Get existing columns in compilations table
         cursor = conn.execute("PRAGMA table_info(compilations)")
         compilation_columns = {row[1] for row in cursor.fetchall()}
@@ -205,36 +340,52 @@ class Database:
         # Add auto_approved if missing
         if "auto_approved" not in compilation_columns:
             conn.execute("ALTER TABLE compilations ADD COLUMN auto_approved INTEGER DEFAULT 0")
+            migrated = True
 
         # Add confidence_score if missing
         if "confidence_score" not in compilation_columns:
             conn.execute("ALTER TABLE compilations ADD COLUMN confidence_score REAL DEFAULT 0")
+            migrated = True
 
         # Get existing columns in videos table
-        cursor = conn.execute("PRAGMA table_info(videos)")
+        cursor = conn.execute("PRAGMA table_xinfo(videos)")
         video_columns = {row[1] for row in cursor.fetchall()}
 
         # Add subcategory if missing
         if "subcategory" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN subcategory TEXT DEFAULT ''")
+            migrated = True
 
         # Add compilation_score if missing
         if "compilation_score" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN compilation_score REAL DEFAULT 0")
+            migrated = True
 
         # Add visual_independence if missing
         if "visual_independence" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN visual_independence REAL DEFAULT 0")
+            migrated = True
 
         # Add source compilation tracking fields
         if "is_source_compilation" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN is_source_compilation INTEGER DEFAULT 0")
+            migrated = True
 
         if "source_clip_count" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN source_clip_count INTEGER DEFAULT 0")
+            migrated = True
 
         if "compilation_type" not in video_columns:
             conn.execute("ALTER TABLE videos ADD COLUMN compilation_type TEXT DEFAULT ''")
+            migrated = True
+
+        # Generated ranking column (ALTER TABLE only supports VIRTUAL ones)
+        if "engagement_score" not in video_columns:
+            conn.execute(
+                "ALTER TABLE videos ADD COLUMN engagement_score INTEGER "
+                "GENERATED ALWAYS AS (likes + shares * 2) VIRTUAL"
+            )
+            migrated = True
 
         # Create index on subcategory (after column exists)
         try:
@@ -242,12 +393,213 @@ class Database:
         except sqlite3.OperationalError:
             pass  # Index already exists or column missing
 
+        # Index category + engagement so ranking reads come pre-sorted
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_category_engagement "
+            "ON videos(category, engagement_score DESC)"
+        )
+
+        # One upload per compilation/account pair; also serves compilation_id lookups
+        try:
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_uploads_comp_account "
+                "ON uploads(compilation_id, account_id)"
+            )
+        except sqlite3.IntegrityError:
+            # Legacy duplicate rows: keep the lookup fast without the constraint
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_uploads_comp_account_dup "
+                "ON uploads(compilation_id, account_id)"
+            )
+
         # Create index on is_source_compilation for efficient querying
         try:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_source_compilation ON videos(is_source_compilation)")
         except sqlite3.OperationalError:
             pass
 
+        return migrated
+
+    @classmethod
+    def _changed_columns(cls, model) -> dict:
+        """
+        Get the columns of a dirty-tracked model that need writing.
+
+        Returns the full to_db_dict() for untracked models, only the
+        assigned or in-place-mutated columns (plus id) for tracked ones, or {}
+        if nothing changed. Tracked models encode just those columns, never
+        building the full dict.
+        """
+        dirty = model.dirty_fields
+        if dirty is None:
+            return model.to_db_dict()
+        changed = {}
+        for name in model.DB_FIELDS:
+            if name in dirty and name != "id":
+                value = getattr(model, name)
+                if isinstance(value, (list, dict)):
+                    # Same text as a full write, cached until reassigned
+                    changed[name] = model._serialize_field(name, _json_dumps)
+                else:
+                    changed[name] = cls._to_db_value(value)
+        changed.update(model.changed_json_fields())
+        if not changed:
+            return {}
+        changed["id"] = model.id
+        return changed
+
+    @staticmethod
+    def _limit_param(limit: Optional[int]) -> int:
+        """Bind value for LIMIT ?; -1 means no limit, keeping the SQL text constant."""
+        return limit if limit else -1
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _insert_sql(table: str, columns: tuple, or_ignore: bool = False) -> str:
+        """Build (once per column set) the INSERT statement for a table."""
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        return (
+            f"{verb} INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _update_sql(table: str, columns: tuple) -> str:
+        """Build (once per column set) the UPDATE-by-id statement for a table."""
+        set_clause = ", ".join(f"{c} = ?" for c in columns)
+        return f"UPDATE {table} SET {set_clause} WHERE id = ?"
+
+    @staticmethod
+    def _to_db_value(value):
+        """Convert a model attribute value to its stored column form."""
+        if isinstance(value, Enum):
+            return value._value_
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (list, dict)):
+            return _json_dumps(value)
+        # bools pass through: sqlite3 binds them as INTEGER 0/1
+        return value
+
+    def _update_fields(self, table: str, model_cls, record_id: str, fields: dict) -> None:
+        """
+        Update only the given columns of one row.
+        Field names are checked against the model's fields.
+        """
+        if not fields:
+            return
+        allowed = {f.name for f in dataclass_fields(model_cls)} - {"id"}
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {', '.join(sorted(unknown))}")
+
+        columns = tuple(fields)
+        values = [self._to_db_value(fields[c]) for c in columns]
+        with self._get_connection() as conn:
+            conn.execute(self._update_sql(table, columns), values + [record_id])
+
+    def _insert_many(self, table: str, models: list) -> List[bool]:
+        """
+        Insert many records in a single transaction.
+        Returns one flag per model, False where the row was a duplicate.
+        """
+        if not models:
+            return []
+
+        if hasattr(models[0], "to_db_values"):
+            # Models with a fixed column order skip building a dict per row
+            columns = models[0].DB_FIELDS
+            rows = [model.to_db_values() for model in models]
+        else:
+            columns = tuple(models[0].to_db_dict())
+            rows = []
+            for model in models:
+                data = model.to_db_dict()
+                rows.append([data[c] for c in columns])
+        sql = self._insert_sql(table, columns, or_ignore=True)
+
+        # One execute per row (rather than executemany) so each row's
+        # rowcount tells the caller whether it was inserted or ignored
+        with self._get_connection() as conn:
+            inserted = []
+            for values in rows:
+                cursor = conn.execute(sql, values)
+                inserted.append(cursor.rowcount == 1)
+            return inserted
+
+    # SQLite's default host-parameter limit is 999; stay well below it
+    ID_BATCH_SIZE = 500
+
+    def _get_many_by_ids(self, table: str, model_cls, ids: List[str]) -> dict:
+        """Fetch records by primary key in chunks. Missing IDs are omitted."""
+        result = {}
+        unique_ids = list(dict.fromkeys(ids))
+        with self._get_ro_connection() as conn:
+            for start in range(0, len(unique_ids), self.ID_BATCH_SIZE):
+                chunk = unique_ids[start:start + self.ID_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                for row in rows:
+                    result[row["id"]] = model_cls.from_db_row(row)
+        return result
+
+    # UNIQUE external-ID column checked by each table's *_id_exists method
+    EXTERNAL_ID_COLUMNS = {"videos": "tiktok_id", "reddit_posts": "reddit_id"}
+
+    def _external_ids(self, table: str) -> Set[str]:
+        """
+        Get the in-memory set of external IDs for a table, loading it on first use.
+        Rows inserted by other processes are not seen, but the UNIQUE constraint
+        still rejects their duplicates on insert. Rows they delete are caught
+        by _external_id_exists, which confirms every hit against the table.
+        """
+        with self._id_cache_lock:
+            ids = self._id_caches.get(table)
+            if ids is None:
+                column = self.EXTERNAL_ID_COLUMNS[table]
+                with self._get_ro_connection() as conn:
+                    cursor = conn.execute(
+                        f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL"
+                    )
+                    cursor.row_factory = None
+                    ids = {row[0] for row in cursor}
+                self._id_caches[table] = ids
+            return ids
+
+    def _external_id_exists(self, table: str, external_id: str) -> bool:
+        """
+        Check an external ID against the cache. Misses (new candidates) are
+        answered from memory; hits are confirmed with a one-row lookup so IDs
+        deleted elsewhere are not reported as present.
+        """
+        ids = self._external_ids(table)
+        if external_id not in ids:
+            return False
+        column = self.EXTERNAL_ID_COLUMNS[table]
+        with self._get_ro_connection() as conn:
+            found = conn.execute(
+                f"SELECT 1 FROM {table} WHERE {column} = ?", (external_id,)
+            ).fetchone() is not None
+        if not found:
+            with self._id_cache_lock:
+                ids.discard(external_id)
+        return found
+
+    def _remember_external_ids(self, table: str, ids: Iterable[str]) -> None:
+        """Add newly inserted external IDs to the cache if it is loaded."""
+        with self._id_cache_lock:
+            cached = self._id_caches.get(table)
+            if cached is not None:
+                cached.update(ids)
+
+    def _forget_external_ids(self, table: str) -> None:
+        """Drop a table's cached external IDs so the next check reloads them."""
+        with self._id_cache_lock:
+            self._id_caches.pop(table, None)
+
     # =========================================================================
     # Video CRUD Operations
     # =========================================================================
@@ -256,54 +608,104 @@ class Database:
         """Insert a new video record. Returns False if duplicate."""
         with self._get_connection() as conn:
             try:
-                data = video.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
-                conn.execute(
-                    f"INSERT INTO videos ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
-                return True
+                conn.execute(self._insert_sql("videos", Video.DB_FIELDS), video.to_db_values())
             except sqlite3.IntegrityError:
                 return False
+        # The object now matches its row; later updates write only changes
+        video.mark_clean()
+        self._remember_external_ids("videos", [video.tiktok_id])
+        return True
+
+    def insert_videos_bulk(self, videos: List[Video]) -> List[bool]:
+        """Insert many video records. Returns False for each duplicate."""
+        inserted = self._insert_many("videos", videos)
+        stored = [v for v, ok in zip(videos, inserted) if ok]
+        for video in stored:
+            video.mark_clean()
+        self._remember_external_ids("videos", [v.tiktok_id for v in stored])
+        return inserted
 
     def update_video(self, video: Video) -> None:
-        """Update an existing video record."""
+        """Update an existing video record, writing only changed columns."""
+        data = self._changed_columns(video)
+        if not data:
+            return
+        video_id = data.pop("id")
         with self._get_connection() as conn:
-            data = video.to_db_dict()
-            video_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE videos SET {set_clause} WHERE id = ?",
+                self._update_sql("videos", tuple(data)),
                 list(data.values()) + [video_id]
             )
+        video.mark_clean()
+
+    def update_video_fields(self, video_id: str, **fields) -> None:
+        """Update only the given video columns, e.g. status and error."""
+        self._update_fields("videos", Video, video_id, fields)
+
+    def update_video_captions(self, captions: Dict[str, str]) -> None:
+        """Set the caption of many videos in one transaction, keyed by video ID."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "UPDATE videos SET caption = ? WHERE id = ?",
+                [(caption, video_id) for video_id, caption in captions.items()]
+            )
+
+    def assign_videos_to_compilation(
+        self,
+        compilation_id: str,
+        ordered_video_ids: List[str],
+        status: VideoStatus = VideoStatus.GROUPED,
+    ) -> None:
+        """
+        Link videos to a compilation in one transaction.
+        Each video's clip_order is its position in ordered_video_ids.
+        """
+        # Each id is bound twice (CASE arm + IN list), so halve the batch size
+        batch_size = self.ID_BATCH_SIZE // 2
+        with self._get_connection() as conn:
+            for start in range(0, len(ordered_video_ids), batch_size):
+                chunk = ordered_video_ids[start:start + batch_size]
+                case_arms = " ".join("WHEN ? THEN ?" for _ in chunk)
+                placeholders = ", ".join("?" * len(chunk))
+                params = [compilation_id, status.value]
+                for order, video_id in enumerate(chunk, start):
+                    params.extend((video_id, order))
+                params.extend(chunk)
+                conn.execute(
+                    f"""UPDATE videos
+                        SET compilation_id = ?, status = ?,
+                            clip_order = CASE id {case_arms} END
+                        WHERE id IN ({placeholders})""",
+                    params
+                )
 
     def get_video(self, video_id: str) -> Optional[Video]:
         """Get a video by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM videos WHERE id = ?", (video_id,)
             ).fetchone()
-            return Video.from_db_row(dict(row)) if row else None
+            return Video.from_db_row(row) if row else None
+
+    def get_videos_by_ids(self, video_ids: List[str]) -> Dict[str, Video]:
+        """Get many videos by ID in batched queries, keyed by ID."""
+        return self._get_many_by_ids("videos", Video, video_ids)
 
     def get_video_by_tiktok_id(self, tiktok_id: str) -> Optional[Video]:
         """Get a video by TikTok ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM videos WHERE tiktok_id = ?", (tiktok_id,)
             ).fetchone()
-            return Video.from_db_row(dict(row)) if row else None
+            return Video.from_db_row(row) if row else None
 
     def get_videos_by_status(
         self, status: VideoStatus, limit: Optional[int] = None
     ) -> List[Video]:
         """Get videos by status."""
-        with self._get_connection() as conn:
-            query = "SELECT * FROM videos WHERE status = ? ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query, (status.value,)).fetchall()
-            return [Video.from_db_row(dict(row)) for row in rows]
+        with self._get_ro_connection() as conn:
+            query = "SELECT * FROM videos WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+            return self._fetch_models(conn, Video, query, (status.value, self._limit_param(limit)))
 
     def get_videos_by_category(
         self,
@@ -312,7 +714,7 @@ class Database:
         unassigned_only: bool = False,
     ) -> List[Video]:
         """Get videos by category with optional filters."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             query = "SELECT * FROM videos WHERE category = ?"
             params = [category]
 
@@ -323,9 +725,8 @@ class Database:
             if unassigned_only:
                 query += " AND (compilation_id IS NULL OR compilation_id = '')"
 
-            query += " ORDER BY (likes + shares * 2) DESC"
-            rows = conn.execute(query, params).fetchall()
-            return [Video.from_db_row(dict(row)) for row in rows]
+            query += " ORDER BY engagement_score DESC"
+            return self._fetch_models(conn, Video, query, params)
 
     def get_videos_by_subcategory(
         self,
@@ -335,7 +736,7 @@ class Database:
         unassigned_only: bool = False,
     ) -> List[Video]:
         """Get videos by category and subcategory with optional filters."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             query = "SELECT * FROM videos WHERE category = ? AND subcategory = ?"
             params = [category, subcategory]
 
@@ -347,9 +748,8 @@ class Database:
                 query += " AND (compilation_id IS NULL OR compilation_id = '')"
 
             # Sort by compilation_score first, then engagement
-            query += " ORDER BY compilation_score DESC, (likes + shares * 2) DESC"
-            rows = conn.execute(query, params).fetchall()
-            return [Video.from_db_row(dict(row)) for row in rows]
+            query += " ORDER BY compilation_score DESC, engagement_score DESC"
+            return self._fetch_models(conn, Video, query, params)
 
     def get_available_subcategories(
         self,
@@ -358,26 +758,24 @@ class Database:
         status: VideoStatus = VideoStatus.CLASSIFIED,
     ) -> dict:
         """Get subcategories with enough videos for compilation."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                """SELECT subcategory, COUNT(*) as count FROM videos
-                   WHERE category = ? AND status = ? AND subcategory != ''
-                   AND (compilation_id IS NULL OR compilation_id = '')
-                   GROUP BY subcategory
-                   HAVING count >= ?
-                   ORDER BY count DESC""",
-                (category, status.value, min_videos)
-            ).fetchall()
-            return {row["subcategory"]: row["count"] for row in rows}
+        return self._count_groups(
+            """SELECT subcategory, COUNT(*) as count FROM videos
+               WHERE category = ? AND status = ? AND subcategory != ''
+               AND (compilation_id IS NULL OR compilation_id = '')
+               GROUP BY subcategory
+               HAVING count >= ?
+               ORDER BY count DESC""",
+            (category, status.value, min_videos)
+        )
 
     def get_videos_for_compilation(self, compilation_id: str) -> List[Video]:
         """Get all videos assigned to a compilation, ordered by clip_order."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
+        with self._get_ro_connection() as conn:
+            return self._fetch_models(
+                conn, Video,
                 "SELECT * FROM videos WHERE compilation_id = ? ORDER BY clip_order",
                 (compilation_id,)
-            ).fetchall()
-            return [Video.from_db_row(dict(row)) for row in rows]
+            )
 
     def get_source_compilations(
         self,
@@ -387,7 +785,7 @@ class Database:
         limit: Optional[int] = None,
     ) -> List[Video]:
         """Get videos that are source compilations (existing compilations from TikTok)."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             query = "SELECT * FROM videos WHERE is_source_compilation = 1"
             params = []
 
@@ -403,50 +801,39 @@ class Database:
                 query += " AND (compilation_id IS NULL OR compilation_id = '')"
 
             # Sort by quality and duration (longer = more content)
-            query += " ORDER BY compilation_score DESC, duration DESC"
+            query += " ORDER BY compilation_score DESC, duration DESC LIMIT ?"
+            params.append(self._limit_param(limit))
 
-            if limit:
-                query += f" LIMIT {limit}"
-
-            rows = conn.execute(query, params).fetchall()
-            return [Video.from_db_row(dict(row)) for row in rows]
+            return self._fetch_models(conn, Video, query, params)
 
     def count_videos_by_status(self) -> dict:
         """Get count of videos for each status."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM videos GROUP BY status"
-            ).fetchall()
-            return {row["status"]: row["count"] for row in rows}
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM videos GROUP BY status"
+        )
 
     def count_videos_by_category(self, status: Optional[VideoStatus] = None) -> dict:
         """Get count of videos for each category."""
-        with self._get_connection() as conn:
-            if status:
-                rows = conn.execute(
-                    """SELECT category, COUNT(*) as count FROM videos
-                       WHERE status = ? AND category != '' GROUP BY category""",
-                    (status.value,)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """SELECT category, COUNT(*) as count FROM videos
-                       WHERE category != '' GROUP BY category"""
-                ).fetchall()
-            return {row["category"]: row["count"] for row in rows}
+        if status:
+            return self._count_groups(
+                """SELECT category, COUNT(*) FROM videos
+                   WHERE status = ? AND category != '' GROUP BY category""",
+                (status.value,)
+            )
+        return self._count_groups(
+            """SELECT category, COUNT(*) FROM videos
+               WHERE category != '' GROUP BY category"""
+        )
 
     def tiktok_id_exists(self, tiktok_id: str) -> bool:
         """Check if a TikTok ID already exists in the database."""
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM videos WHERE tiktok_id = ? LIMIT 1", (tiktok_id,)
-            ).fetchone()
-            return row is not None
+        return self._external_id_exists("videos", tiktok_id)
 
     def delete_video(self, video_id: str) -> None:
         """Delete a video record."""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM videos WHERE id = ?", (video_id,))
+        self._forget_external_ids("videos")
 
     # =========================================================================
     # Compilation CRUD Operations
@@ -456,66 +843,102 @@ class Database:
         """Insert a new compilation record."""
         with self._get_connection() as conn:
             try:
-                data = compilation.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
                 conn.execute(
-                    f"INSERT INTO compilations ({columns}) VALUES ({placeholders})",
-                    list(data.values())
+                    self._insert_sql("compilations", Compilation.DB_FIELDS),
+                    compilation.to_db_values()
                 )
-                return True
             except sqlite3.IntegrityError:
                 return False
+        # The object now matches its row; later updates write only changes
+        compilation.mark_clean()
+        return True
 
     def update_compilation(self, compilation: Compilation) -> None:
-        """Update an existing compilation record."""
+        """Update an existing compilation record, writing only changed columns."""
+        data = self._changed_columns(compilation)
+        if not data:
+            return
+        comp_id = data.pop("id")
         with self._get_connection() as conn:
-            data = compilation.to_db_dict()
-            comp_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE compilations SET {set_clause} WHERE id = ?",
+                self._update_sql("compilations", tuple(data)),
                 list(data.values()) + [comp_id]
             )
+        compilation.mark_clean()
+
+    def update_compilation_fields(self, compilation_id: str, **fields) -> None:
+        """Update only the given compilation columns."""
+        self._update_fields("compilations", Compilation, compilation_id, fields)
+
+    def update_compilation_statuses(
+        self, compilation_ids: List[str], status: CompilationStatus
+    ) -> None:
+        """Set the status of many compilations in one transaction."""
+        with self._get_connection() as conn:
+            for start in range(0, len(compilation_ids), self.ID_BATCH_SIZE):
+                chunk = compilation_ids[start:start + self.ID_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                conn.execute(
+                    f"UPDATE compilations SET status = ? WHERE id IN ({placeholders})",
+                    [status.value, *chunk]
+                )
 
     def get_compilation(self, compilation_id: str) -> Optional[Compilation]:
         """Get a compilation by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM compilations WHERE id = ?", (compilation_id,)
             ).fetchone()
-            return Compilation.from_db_row(dict(row)) if row else None
+            return Compilation.from_db_row(row) if row else None
+
+    def get_compilations_by_ids(self, compilation_ids: List[str]) -> Dict[str, Compilation]:
+        """Get many compilations by ID in batched queries, keyed by ID."""
+        return self._get_many_by_ids("compilations", Compilation, compilation_ids)
 
     def get_compilations_by_status(
         self, status: CompilationStatus, limit: Optional[int] = None
     ) -> List[Compilation]:
         """Get compilations by status."""
-        with self._get_connection() as conn:
-            query = "SELECT * FROM compilations WHERE status = ? ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query, (status.value,)).fetchall()
-            return [Compilation.from_db_row(dict(row)) for row in rows]
+        with self._get_ro_connection() as conn:
+            query = "SELECT * FROM compilations WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+            return self._fetch_models(conn, Compilation, query, (status.value, self._limit_param(limit)))
+
+    def iter_all_compilations(self) -> Iterator[Compilation]:
+        """
+        Stream all compilations without materializing the full list.
+        Holds a read connection until the iterator is exhausted or closed.
+        """
+        with self._get_ro_connection() as conn:
+            for row in conn.execute("SELECT * FROM compilations ORDER BY created_at DESC"):
+                yield Compilation.from_db_row(row)
 
     def get_all_compilations(self) -> List[Compilation]:
         """Get all compilations."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM compilations ORDER BY created_at DESC"
-            ).fetchall()
-            return [Compilation.from_db_row(dict(row)) for row in rows]
+        return list(self.iter_all_compilations())
 
     def count_compilations_by_status(self) -> dict:
         """Get count of compilations for each status."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM compilations GROUP BY status"
-            ).fetchall()
-            return {row["status"]: row["count"] for row in rows}
-
-    def delete_compilation(self, compilation_id: str) -> None:
-        """Delete a compilation and unassign its videos."""
-        with self._get_connection() as conn:
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM compilations GROUP BY status"
+        )
+
+    def count_compilations_by_category(self, statuses: List[CompilationStatus]) -> dict:
+        """Get count of compilations in any of the given statuses for each category."""
+        placeholders = ", ".join("?" * len(statuses))
+        return self._count_groups(
+            f"""SELECT category, COUNT(*) FROM compilations
+                WHERE status IN ({placeholders}) GROUP BY category""",
+            tuple(s.value for s in statuses)
+        )
+
+    def delete_compilation(self, compilation_id: str) -> bool:
+        """
+        Delete a compilation and unassign its videos in one transaction.
+        Returns True if the compilation existed.
+        """
+        with self._get_connection() as conn:
+            # Take the write lock up front so both statements commit together
+            conn.execute("BEGIN IMMEDIATE")
             # Unassign videos
             conn.execute(
                 """UPDATE videos
@@ -524,7 +947,8 @@ class Database:
                 (compilation_id,)
             )
             # Delete compilation
-            conn.execute("DELETE FROM compilations WHERE id = ?", (compilation_id,))
+            cursor = conn.execute("DELETE FROM compilations WHERE id = ?", (compilation_id,))
+            return cursor.rowcount > 0
 
     # =========================================================================
     # Utility Operations
@@ -535,23 +959,72 @@ class Database:
         with self._get_connection() as conn:
             conn.execute("DELETE FROM videos")
             conn.execute("DELETE FROM compilations")
+        self._forget_external_ids("videos")
+
+    def optimize(self) -> None:
+        """Refresh planner statistics that have drifted (call periodically)."""
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA optimize")
+
+    @staticmethod
+    def _fetch_models(conn: sqlite3.Connection, model_cls, query: str, params=()) -> list:
+        """Run a SELECT and build models positionally from plain tuples."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        columns = tuple(d[0] for d in cursor.description)
+        return model_cls.from_row_tuples(columns, cursor)
+
+    def _count_groups(self, query: str, params: tuple = ()) -> dict:
+        """Run a two-column (key, count) query and return it as a dict."""
+        with self._get_ro_connection() as conn:
+            # Plain tuples feed dict() directly, skipping sqlite3.Row creation
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return dict(cursor.execute(query, params))
+
+    def _tagged_counts(self, query: str, params: tuple, totals: List[str]) -> dict:
+        """
+        Run a UNION ALL of (tag, key, count) rows and bucketize the result.
+        Tags listed in totals are always scalars; every other tag is always a
+        {key: count} dict, with a NULL key counted under "unknown".
+        """
+        totals = set(totals)
+        stats = {tag: 0 for tag in totals}
+        with self._get_ro_connection() as conn:
+            for tag, key, count in conn.execute(query, params):
+                if tag in totals:
+                    stats[tag] = count
+                else:
+                    bucket = stats.setdefault(tag, {})
+                    key = "unknown" if key is None else key
+                    bucket[key] = bucket.get(key, 0) + count
+        return stats
 
     def get_stats(self) -> dict:
-        """Get overall pipeline statistics."""
-        video_status_counts = self.count_videos_by_status()
-        compilation_status_counts = self.count_compilations_by_status()
-        category_counts = self.count_videos_by_category(VideoStatus.CLASSIFIED)
-
-        with self._get_connection() as conn:
-            total_videos = conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
-            total_compilations = conn.execute("SELECT COUNT(*) FROM compilations").fetchone()[0]
+        """Get overall pipeline statistics in a single query."""
+        stats = self._tagged_counts(
+            """SELECT 'total_videos', NULL, COUNT(*) FROM videos
+               UNION ALL
+               SELECT 'total_compilations', NULL, COUNT(*) FROM compilations
+               UNION ALL
+               SELECT 'videos_by_status', status, COUNT(*) FROM videos GROUP BY status
+               UNION ALL
+               SELECT 'compilations_by_status', status, COUNT(*) FROM compilations
+                   GROUP BY status
+               UNION ALL
+               SELECT 'videos_by_category', category, COUNT(*) FROM videos
+                   WHERE status = ? AND category != '' GROUP BY category""",
+            (VideoStatus.CLASSIFIED.value,),
+            totals=["total_videos", "total_compilations"],
+        )
 
         return {
-            "total_videos": total_videos,
-            "total_compilations": total_compilations,
-            "videos_by_status": video_status_counts,
-            "compilations_by_status": compilation_status_counts,
-            "videos_by_category": category_counts,
+            "total_videos": stats["total_videos"],
+            "total_compilations": stats["total_compilations"],
+            "videos_by_status": stats.get("videos_by_status", {}),
+            "compilations_by_status": stats.get("compilations_by_status", {}),
+            "videos_by_category": stats.get("videos_by_category", {}),
         }
 
     # =========================================================================
@@ -560,88 +1033,72 @@ class Database:
 
     def insert_account(self, account: Account) -> bool:
         """Insert a new account record."""
+        data = account.to_db_dict()
         with self._get_connection() as conn:
             try:
-                data = account.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
-                conn.execute(
-                    f"INSERT INTO accounts ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
+                conn.execute(self._insert_sql("accounts", tuple(data)), list(data.values()))
                 return True
             except sqlite3.IntegrityError:
                 return False
 
     def update_account(self, account: Account) -> None:
         """Update an existing account record."""
+        data = account.to_db_dict()
+        account_id = data.pop("id")
         with self._get_connection() as conn:
-            data = account.to_db_dict()
-            account_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE accounts SET {set_clause} WHERE id = ?",
+                self._update_sql("accounts", tuple(data)),
                 list(data.values()) + [account_id]
             )
 
     def get_account(self, account_id: str) -> Optional[Account]:
         """Get an account by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM accounts WHERE id = ?", (account_id,)
             ).fetchone()
-            return Account.from_db_row(dict(row)) if row else None
+            return Account.from_db_row(row) if row else None
 
     def get_accounts_by_platform(
         self, platform: Platform, active_only: bool = True
     ) -> List[Account]:
         """Get accounts by platform."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             if active_only:
-                rows = conn.execute(
-                    "SELECT * FROM accounts WHERE platform = ? AND is_active = 1 ORDER BY name",
-                    (platform.value,)
-                ).fetchall()
+                query = "SELECT * FROM accounts WHERE platform = ? AND is_active = 1 ORDER BY name"
             else:
-                rows = conn.execute(
-                    "SELECT * FROM accounts WHERE platform = ? ORDER BY name",
-                    (platform.value,)
-                ).fetchall()
-            return [Account.from_db_row(dict(row)) for row in rows]
+                query = "SELECT * FROM accounts WHERE platform = ? ORDER BY name"
+            return self._fetch_models(conn, Account, query, (platform.value,))
 
     def get_accounts_by_strategy(
         self, strategy: ContentStrategy, platform: Optional[Platform] = None
     ) -> List[Account]:
         """Get accounts by content strategy."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             if platform:
-                rows = conn.execute(
+                return self._fetch_models(
+                    conn, Account,
                     """SELECT * FROM accounts
                        WHERE content_strategy = ? AND platform = ? AND is_active = 1
                        ORDER BY name""",
                     (strategy.value, platform.value)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """SELECT * FROM accounts
-                       WHERE content_strategy = ? AND is_active = 1
-                       ORDER BY name""",
-                    (strategy.value,)
-                ).fetchall()
-            return [Account.from_db_row(dict(row)) for row in rows]
+                )
+            return self._fetch_models(
+                conn, Account,
+                """SELECT * FROM accounts
+                   WHERE content_strategy = ? AND is_active = 1
+                   ORDER BY name""",
+                (strategy.value,)
+            )
 
     def get_all_accounts(self, active_only: bool = True) -> List[Account]:
         """Get all accounts."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             if active_only:
-                rows = conn.execute(
-                    "SELECT * FROM accounts WHERE is_active = 1 ORDER BY platform, name"
-                ).fetchall()
+                query = "SELECT * FROM accounts WHERE is_active = 1 ORDER BY platform, name"
             else:
-                rows = conn.execute(
-                    "SELECT * FROM accounts ORDER BY platform, name"
-                ).fetchall()
-            return [Account.from_db_row(dict(row)) for row in rows]
+                query = "SELECT * FROM accounts ORDER BY platform, name"
+            return self._fetch_models(conn, Account, query)
 
     def delete_account(self, account_id: str) -> None:
         """Delete an account and its routing rules."""
@@ -672,95 +1129,116 @@ class Database:
         """Insert a new upload record."""
         with self._get_connection() as conn:
             try:
-                data = upload.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
-                conn.execute(
-                    f"INSERT INTO uploads ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
+                conn.execute(self._insert_sql("uploads", Upload.DB_FIELDS), upload.to_db_values())
                 return True
             except sqlite3.IntegrityError:
                 return False
 
+    def insert_uploads_bulk(self, uploads: List[Upload]) -> List[bool]:
+        """Insert many upload records. Returns False for each duplicate."""
+        return self._insert_many("uploads", uploads)
+
     def update_upload(self, upload: Upload) -> None:
         """Update an existing upload record."""
+        upload_id, *values = upload.to_db_values()
         with self._get_connection() as conn:
-            data = upload.to_db_dict()
-            upload_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-            conn.execute(
-                f"UPDATE uploads SET {set_clause} WHERE id = ?",
-                list(data.values()) + [upload_id]
-            )
+            conn.execute(self._update_sql("uploads", Upload.DB_FIELDS[1:]), values + [upload_id])
+
+    def update_upload_fields(self, upload_id: str, **fields) -> None:
+        """Update only the given upload columns."""
+        self._update_fields("uploads", Upload, upload_id, fields)
 
     def get_upload(self, upload_id: str) -> Optional[Upload]:
         """Get an upload by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM uploads WHERE id = ?", (upload_id,)
             ).fetchone()
-            return Upload.from_db_row(dict(row)) if row else None
+            return Upload.from_db_row(row) if row else None
+
+    def get_uploads_by_ids(self, upload_ids: List[str]) -> Dict[str, Upload]:
+        """Get many uploads by ID in batched queries, keyed by ID."""
+        return self._get_many_by_ids("uploads", Upload, upload_ids)
 
     def get_uploads_by_status(
         self, status: UploadStatus, limit: Optional[int] = None
     ) -> List[Upload]:
         """Get uploads by status."""
-        with self._get_connection() as conn:
-            query = "SELECT * FROM uploads WHERE status = ? ORDER BY created_at"
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query, (status.value,)).fetchall()
-            return [Upload.from_db_row(dict(row)) for row in rows]
+        with self._get_ro_connection() as conn:
+            query = "SELECT * FROM uploads WHERE status = ? ORDER BY created_at LIMIT ?"
+            return self._fetch_models(conn, Upload, query, (status.value, self._limit_param(limit)))
 
     def get_uploads_for_compilation(self, compilation_id: str) -> List[Upload]:
         """Get all uploads for a compilation."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
+        with self._get_ro_connection() as conn:
+            return self._fetch_models(
+                conn, Upload,
                 "SELECT * FROM uploads WHERE compilation_id = ? ORDER BY created_at",
                 (compilation_id,)
-            ).fetchall()
-            return [Upload.from_db_row(dict(row)) for row in rows]
+            )
+
+    def count_uploads_by_status(self) -> dict:
+        """Get count of uploads for each status."""
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM uploads GROUP BY status"
+        )
+
+    def count_uploads_for_account(self, account_id: str) -> dict:
+        """Get count of an account's uploads for each status."""
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM uploads WHERE account_id = ? GROUP BY status",
+            (account_id,)
+        )
 
     def get_uploads_for_account(
         self, account_id: str, status: Optional[UploadStatus] = None
     ) -> List[Upload]:
         """Get uploads for an account."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             if status:
-                rows = conn.execute(
+                return self._fetch_models(
+                    conn, Upload,
                     "SELECT * FROM uploads WHERE account_id = ? AND status = ? ORDER BY created_at DESC",
                     (account_id, status.value)
-                ).fetchall()
+                )
             else:
-                rows = conn.execute(
+                return self._fetch_models(
+                    conn, Upload,
                     "SELECT * FROM uploads WHERE account_id = ? ORDER BY created_at DESC",
                     (account_id,)
-                ).fetchall()
-            return [Upload.from_db_row(dict(row)) for row in rows]
+                )
 
-    def get_pending_uploads(self, limit: Optional[int] = None) -> List[Upload]:
-        """Get pending uploads ordered by scheduled time."""
-        with self._get_connection() as conn:
-            query = """SELECT * FROM uploads
-                       WHERE status = 'pending'
-                       ORDER BY COALESCE(scheduled_at, created_at)"""
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query).fetchall()
-            return [Upload.from_db_row(dict(row)) for row in rows]
+    def get_pending_uploads(
+        self, limit: Optional[int] = None, platform: Optional[Platform] = None
+    ) -> List[Upload]:
+        """Get pending uploads ordered by scheduled time, optionally for one platform."""
+        with self._get_ro_connection() as conn:
+            if platform:
+                query = """SELECT * FROM uploads
+                           WHERE status = 'pending' AND platform = ?
+                           ORDER BY COALESCE(scheduled_at, created_at)
+                           LIMIT ?"""
+                params = (platform.value, self._limit_param(limit))
+            else:
+                query = """SELECT * FROM uploads
+                           WHERE status = 'pending'
+                           ORDER BY COALESCE(scheduled_at, created_at)
+                           LIMIT ?"""
+                params = (self._limit_param(limit),)
+            return self._fetch_models(conn, Upload, query, params)
 
     def upload_exists_for_compilation_account(
         self, compilation_id: str, account_id: str
     ) -> bool:
         """Check if an upload already exists for this compilation/account pair."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
-                """SELECT 1 FROM uploads
-                   WHERE compilation_id = ? AND account_id = ? LIMIT 1""",
+                """SELECT EXISTS(
+                       SELECT 1 FROM uploads WHERE compilation_id = ? AND account_id = ?
+                   )""",
                 (compilation_id, account_id)
             ).fetchone()
-            return row is not None
+            return bool(row[0])
 
     def delete_upload(self, upload_id: str) -> None:
         """Delete an upload record."""
@@ -773,66 +1251,65 @@ class Database:
 
     def insert_routing_rule(self, rule: RoutingRule) -> bool:
         """Insert a new routing rule."""
+        data = rule.to_db_dict()
         with self._get_connection() as conn:
             try:
-                data = rule.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
-                conn.execute(
-                    f"INSERT INTO routing_rules ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
+                conn.execute(self._insert_sql("routing_rules", tuple(data)), list(data.values()))
                 return True
             except sqlite3.IntegrityError:
                 return False
 
     def update_routing_rule(self, rule: RoutingRule) -> None:
         """Update an existing routing rule."""
+        data = rule.to_db_dict()
+        rule_id = data.pop("id")
         with self._get_connection() as conn:
-            data = rule.to_db_dict()
-            rule_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE routing_rules SET {set_clause} WHERE id = ?",
+                self._update_sql("routing_rules", tuple(data)),
                 list(data.values()) + [rule_id]
             )
 
     def get_routing_rule(self, rule_id: str) -> Optional[RoutingRule]:
         """Get a routing rule by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM routing_rules WHERE id = ?", (rule_id,)
             ).fetchone()
-            return RoutingRule.from_db_row(dict(row)) if row else None
+            return RoutingRule.from_db_row(row) if row else None
 
     def get_routing_rules_for_account(self, account_id: str) -> List[RoutingRule]:
         """Get all routing rules for an account."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
+        with self._get_ro_connection() as conn:
+            return self._fetch_models(
+                conn, RoutingRule,
                 "SELECT * FROM routing_rules WHERE account_id = ? ORDER BY priority DESC",
                 (account_id,)
-            ).fetchall()
-            return [RoutingRule.from_db_row(dict(row)) for row in rows]
+            )
 
     def get_routing_rules_for_category(self, category: str) -> List[RoutingRule]:
         """Get all routing rules for a category, ordered by priority."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
+        with self._get_ro_connection() as conn:
+            return self._fetch_models(
+                conn, RoutingRule,
                 """SELECT r.* FROM routing_rules r
                    JOIN accounts a ON r.account_id = a.id
                    WHERE r.category = ? AND a.is_active = 1
                    ORDER BY r.priority DESC""",
                 (category,)
-            ).fetchall()
-            return [RoutingRule.from_db_row(dict(row)) for row in rows]
+            )
+
+    def iter_all_routing_rules(self) -> Iterator[RoutingRule]:
+        """
+        Stream all routing rules without materializing the full list.
+        Holds a read connection until the iterator is exhausted or closed.
+        """
+        with self._get_ro_connection() as conn:
+            for row in conn.execute("SELECT * FROM routing_rules ORDER BY account_id, priority DESC"):
+                yield RoutingRule.from_db_row(row)
 
     def get_all_routing_rules(self) -> List[RoutingRule]:
         """Get all routing rules."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM routing_rules ORDER BY account_id, priority DESC"
-            ).fetchall()
-            return [RoutingRule.from_db_row(dict(row)) for row in rows]
+        return list(self.iter_all_routing_rules())
 
     def delete_routing_rule(self, rule_id: str) -> None:
         """Delete a routing rule."""
@@ -847,93 +1324,114 @@ class Database:
         """Insert a new Reddit post record. Returns False if duplicate."""
         with self._get_connection() as conn:
             try:
-                data = post.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
                 conn.execute(
-                    f"INSERT INTO reddit_posts ({columns}) VALUES ({placeholders})",
-                    list(data.values())
+                    self._insert_sql("reddit_posts", RedditPost.DB_FIELDS), post.to_db_values()
                 )
-                return True
             except sqlite3.IntegrityError:
                 return False
+        self._remember_external_ids("reddit_posts", [post.reddit_id])
+        return True
+
+    def insert_reddit_posts_bulk(self, posts: List[RedditPost]) -> List[bool]:
+        """Insert many Reddit post records. Returns False for each duplicate."""
+        inserted = self._insert_many("reddit_posts", posts)
+        self._remember_external_ids(
+            "reddit_posts", [p.reddit_id for p, ok in zip(posts, inserted) if ok]
+        )
+        return inserted
 
     def update_reddit_post(self, post: RedditPost) -> None:
         """Update an existing Reddit post record."""
+        post_id, *values = post.to_db_values()
         with self._get_connection() as conn:
-            data = post.to_db_dict()
-            post_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE reddit_posts SET {set_clause} WHERE id = ?",
-                list(data.values()) + [post_id]
+                self._update_sql("reddit_posts", RedditPost.DB_FIELDS[1:]), values + [post_id]
             )
 
+    def update_reddit_post_fields(self, post_id: str, **fields) -> None:
+        """Update only the given Reddit post columns."""
+        self._update_fields("reddit_posts", RedditPost, post_id, fields)
+
     def get_reddit_post(self, post_id: str) -> Optional[RedditPost]:
         """Get a Reddit post by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM reddit_posts WHERE id = ?", (post_id,)
             ).fetchone()
-            return RedditPost.from_db_row(dict(row)) if row else None
+            return RedditPost.from_db_row(row) if row else None
+
+    def get_reddit_posts_by_ids(self, post_ids: List[str]) -> Dict[str, RedditPost]:
+        """Get many Reddit posts by ID in batched queries, keyed by ID."""
+        return self._get_many_by_ids("reddit_posts", RedditPost, post_ids)
 
     def get_reddit_post_by_reddit_id(self, reddit_id: str) -> Optional[RedditPost]:
         """Get a Reddit post by Reddit ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM reddit_posts WHERE reddit_id = ?", (reddit_id,)
             ).fetchone()
-            return RedditPost.from_db_row(dict(row)) if row else None
+            return RedditPost.from_db_row(row) if row else None
 
     def get_reddit_posts_by_status(
         self, status: RedditPostStatus, limit: Optional[int] = None
     ) -> List[RedditPost]:
         """Get Reddit posts by status."""
-        with self._get_connection() as conn:
-            query = "SELECT * FROM reddit_posts WHERE status = ? ORDER BY upvotes DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query, (status.value,)).fetchall()
-            return [RedditPost.from_db_row(dict(row)) for row in rows]
+        with self._get_ro_connection() as conn:
+            query = "SELECT * FROM reddit_posts WHERE status = ? ORDER BY upvotes DESC LIMIT ?"
+            return self._fetch_models(conn, RedditPost, query, (status.value, self._limit_param(limit)))
+
+    def get_reddit_posts(self, limit: Optional[int] = None) -> List[RedditPost]:
+        """Get Reddit posts of any status, grouped in pipeline order, then by upvotes."""
+        status_rank = " ".join(
+            f"WHEN '{status.value}' THEN {rank}" for rank, status in enumerate(RedditPostStatus)
+        )
+        query = f"""SELECT * FROM reddit_posts
+                    WHERE status IN ({", ".join(f"'{s.value}'" for s in RedditPostStatus)})
+                    ORDER BY CASE status {status_rank} END, upvotes DESC
+                    LIMIT ?"""
+        with self._get_ro_connection() as conn:
+            return self._fetch_models(conn, RedditPost, query, (self._limit_param(limit),))
 
     def get_reddit_posts_by_subreddit(
         self, subreddit: str, status: Optional[RedditPostStatus] = None
     ) -> List[RedditPost]:
         """Get Reddit posts by subreddit."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             if status:
-                rows = conn.execute(
+                return self._fetch_models(
+                    conn, RedditPost,
                     "SELECT * FROM reddit_posts WHERE subreddit = ? AND status = ? ORDER BY upvotes DESC",
                     (subreddit, status.value)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM reddit_posts WHERE subreddit = ? ORDER BY upvotes DESC",
-                    (subreddit,)
-                ).fetchall()
-            return [RedditPost.from_db_row(dict(row)) for row in rows]
+                )
+            return self._fetch_models(
+                conn, RedditPost,
+                "SELECT * FROM reddit_posts WHERE subreddit = ? ORDER BY upvotes DESC",
+                (subreddit,)
+            )
 
     def reddit_id_exists(self, reddit_id: str) -> bool:
         """Check if a Reddit ID already exists in the database."""
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM reddit_posts WHERE reddit_id = ? LIMIT 1", (reddit_id,)
-            ).fetchone()
-            return row is not None
+        return self._external_id_exists("reddit_posts", reddit_id)
 
     def count_reddit_posts_by_status(self) -> dict:
         """Get count of Reddit posts for each status."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM reddit_posts GROUP BY status"
-            ).fetchall()
-            return {row["status"]: row["count"] for row in rows}
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM reddit_posts GROUP BY status"
+        )
 
-    def delete_reddit_post(self, post_id: str) -> None:
-        """Delete a Reddit post and its associated video."""
+    def delete_reddit_post(self, post_id: str) -> bool:
+        """
+        Delete a Reddit post and its associated video in one transaction.
+        Returns True if the post existed.
+        """
         with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
             conn.execute("DELETE FROM reddit_videos WHERE post_id = ?", (post_id,))
-            conn.execute("DELETE FROM reddit_posts WHERE id = ?", (post_id,))
+            cursor = conn.execute("DELETE FROM reddit_posts WHERE id = ?", (post_id,))
+            deleted = cursor.rowcount > 0
+        if deleted:
+            self._forget_external_ids("reddit_posts")
+        return deleted
 
     # =========================================================================
     # Reddit Video CRUD Operations
@@ -941,95 +1439,116 @@ class Database:
 
     def insert_reddit_video(self, video: RedditVideo) -> bool:
         """Insert a new Reddit video record."""
+        data = video.to_db_dict()
         with self._get_connection() as conn:
             try:
-                data = video.to_db_dict()
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?" for _ in data])
-                conn.execute(
-                    f"INSERT INTO reddit_videos ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
+                conn.execute(self._insert_sql("reddit_videos", tuple(data)), list(data.values()))
                 return True
             except sqlite3.IntegrityError:
                 return False
 
     def update_reddit_video(self, video: RedditVideo) -> None:
         """Update an existing Reddit video record."""
+        data = video.to_db_dict()
+        video_id = data.pop("id")
         with self._get_connection() as conn:
-            data = video.to_db_dict()
-            video_id = data.pop("id")
-            set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
             conn.execute(
-                f"UPDATE reddit_videos SET {set_clause} WHERE id = ?",
+                self._update_sql("reddit_videos", tuple(data)),
                 list(data.values()) + [video_id]
             )
 
     def get_reddit_video(self, video_id: str) -> Optional[RedditVideo]:
         """Get a Reddit video by ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM reddit_videos WHERE id = ?", (video_id,)
             ).fetchone()
-            return RedditVideo.from_db_row(dict(row)) if row else None
+            return RedditVideo.from_db_row(row) if row else None
 
     def get_reddit_video_by_post_id(self, post_id: str) -> Optional[RedditVideo]:
         """Get a Reddit video by post ID."""
-        with self._get_connection() as conn:
+        with self._get_ro_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM reddit_videos WHERE post_id = ?", (post_id,)
             ).fetchone()
-            return RedditVideo.from_db_row(dict(row)) if row else None
+            return RedditVideo.from_db_row(row) if row else None
 
     def get_reddit_videos_by_status(
         self, status: RedditVideoStatus, limit: Optional[int] = None
     ) -> List[RedditVideo]:
         """Get Reddit videos by status."""
-        with self._get_connection() as conn:
-            query = "SELECT * FROM reddit_videos WHERE status = ? ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            rows = conn.execute(query, (status.value,)).fetchall()
-            return [RedditVideo.from_db_row(dict(row)) for row in rows]
+        with self._get_ro_connection() as conn:
+            query = "SELECT * FROM reddit_videos WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+            return self._fetch_models(conn, RedditVideo, query, (status.value, self._limit_param(limit)))
+
+    def iter_all_reddit_videos(self) -> Iterator[RedditVideo]:
+        """
+        Stream all Reddit videos without materializing the full list.
+        Holds a read connection until the iterator is exhausted or closed.
+        """
+        with self._get_ro_connection() as conn:
+            for row in conn.execute("SELECT * FROM reddit_videos ORDER BY created_at DESC"):
+                yield RedditVideo.from_db_row(row)
 
     def get_all_reddit_videos(self) -> List[RedditVideo]:
         """Get all Reddit videos."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM reddit_videos ORDER BY created_at DESC"
-            ).fetchall()
-            return [RedditVideo.from_db_row(dict(row)) for row in rows]
+        return list(self.iter_all_reddit_videos())
 
     def count_reddit_videos_by_status(self) -> dict:
         """Get count of Reddit videos for each status."""
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM reddit_videos GROUP BY status"
-            ).fetchall()
-            return {row["status"]: row["count"] for row in rows}
+        return self._count_groups(
+            "SELECT status, COUNT(*) FROM reddit_videos GROUP BY status"
+        )
 
-    def delete_reddit_video(self, video_id: str) -> None:
-        """Delete a Reddit video record."""
+    def delete_reddit_video(self, video_id: str) -> bool:
+        """
+        Delete a Reddit video record in one transaction.
+        Returns True if the video existed.
+        """
         with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
             # Clear video_id reference in post
             conn.execute(
                 "UPDATE reddit_posts SET video_id = '' WHERE video_id = ?",
                 (video_id,)
             )
-            conn.execute("DELETE FROM reddit_videos WHERE id = ?", (video_id,))
+            cursor = conn.execute("DELETE FROM reddit_videos WHERE id = ?", (video_id,))
+            return cursor.rowcount > 0
 
     def get_reddit_stats(self) -> dict:
-        """Get Reddit pipeline statistics."""
-        post_status_counts = self.count_reddit_posts_by_status()
-        video_status_counts = self.count_reddit_videos_by_status()
-
-        with self._get_connection() as conn:
-            total_posts = conn.execute("SELECT COUNT(*) FROM reddit_posts").fetchone()[0]
-            total_videos = conn.execute("SELECT COUNT(*) FROM reddit_videos").fetchone()[0]
+        """Get Reddit pipeline statistics in a single query."""
+        stats = self._tagged_counts(
+            """SELECT 'total_posts', NULL, COUNT(*) FROM reddit_posts
+               UNION ALL
+               SELECT 'total_videos', NULL, COUNT(*) FROM reddit_videos
+               UNION ALL
+               SELECT 'posts_by_status', status, COUNT(*) FROM reddit_posts
+                   GROUP BY status
+               UNION ALL
+               SELECT 'videos_by_status', status, COUNT(*) FROM reddit_videos
+                   GROUP BY status""",
+            (),
+            totals=["total_posts", "total_videos"],
+        )
 
         return {
-            "total_posts": total_posts,
-            "total_videos": total_videos,
-            "posts_by_status": post_status_counts,
-            "videos_by_status": video_status_counts,
+            "total_posts": stats["total_posts"],
+            "total_videos": stats["total_videos"],
+            "posts_by_status": stats.get("posts_by_status", {}),
+            "videos_by_status": stats.get("videos_by_status", {}),
         }
+
+
+def get_database(db_path) -> Database:
+    """
+    Get the shared Database for a path.
+    Reusing it keeps one set of connection pools and one schema check per process.
+    """
+    # Spellings of the same file (str/Path, relative/absolute) share one writer
+    return _shared_database(Path(db_path).resolve())
+
+
+@lru_cache(maxsize=None)
+def _shared_database(db_path: Path) -> Database:
+    """Create the Database for a normalized path, once per process."""
+    return Database(db_path)
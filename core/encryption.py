@@ -4,11 +4,62 @@ Uses Fernet symmetric encryption.
 """
 
 import base64
+import binascii
 import hashlib
+import json
 import os
-from typing import Optional
+import struct
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.hmac import HMAC
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Fernet token layout: version | timestamp | IV | ciphertext | HMAC-SHA256
+_FERNET_VERSION = b"\x80"
+_IV_SIZE = 16
+_HMAC_SIZE = 32
+_HEADER_SIZE = len(_FERNET_VERSION) + 8 + _IV_SIZE
+
+# PBKDF2-HMAC-SHA256 parameters for passphrase-derived keys. The salt is
+# fixed because the key must be re-derivable without any stored state.
+KEY_DERIVATION_SALT = b"viral-clips-pipeline"
+KEY_DERIVATION_ITERATIONS = 200_000
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serialize a dictionary to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode()
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@lru_cache(maxsize=32)
+def _load_key(key: bytes) -> Tuple[bytes, bytes, HMAC]:
+    """
+    Split a Fernet key into its signing and encryption halves.
+    Cached per key; the keyed HMAC context is only ever copied, never updated.
+    """
+    try:
+        raw_key = base64.urlsafe_b64decode(key)
+    except binascii.Error as e:
+        raise ValueError("Fernet key must be 32 url-safe base64-encoded bytes") from e
+    if len(raw_key) != 32:
+        raise ValueError("Fernet key must be 32 url-safe base64-encoded bytes")
+    signing_key = raw_key[:16]
+    return signing_key, raw_key[16:], HMAC(signing_key, hashes.SHA256())
 
 
 class CredentialEncryption:
@@ -21,10 +72,19 @@ class CredentialEncryption:
         Args:
             key: Base64-encoded Fernet key, or None to generate from env.
         """
+        self._legacy: Optional["CredentialEncryption"] = None
         if key:
-            self._fernet = Fernet(key.encode() if isinstance(key, str) else key)
+            key_bytes = key.encode() if isinstance(key, str) else key
         else:
-            self._fernet = Fernet(self._get_or_create_key())
+            key_bytes = self._get_or_create_key()
+            passphrase = self._get_passphrase()
+            if passphrase is not None:
+                # Credentials stored before PBKDF2 derivation still decrypt
+                self._legacy = CredentialEncryption(self._derive_legacy_key(passphrase))
+
+        # Tokens are built directly on the cryptography primitives instead
+        # of through a Fernet instance; key material is shared per key
+        self._signing_key, self._encryption_key, self._mac = _load_key(key_bytes)
 
     @staticmethod
     def generate_key() -> str:
@@ -32,29 +92,64 @@ class CredentialEncryption:
         return Fernet.generate_key().decode()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_or_create_key() -> bytes:
-        """Get key from environment or derive from a passphrase."""
+        """
+        Get key from environment or derive from a passphrase.
+        Cached: settings are loaded once per process, so the key cannot change.
+        """
+        passphrase = CredentialEncryption._get_passphrase()
+        if passphrase is None:
+            from config.settings import settings
+            return settings.CREDENTIALS_ENCRYPTION_KEY.encode()
+        return CredentialEncryption._derive_key(passphrase)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_passphrase() -> Optional[str]:
+        """Get the passphrase to derive a key from, or None for a raw Fernet key."""
         from config.settings import settings
 
         key = getattr(settings, 'CREDENTIALS_ENCRYPTION_KEY', None)
 
         if key:
-            # Validate it's a proper Fernet key
-            if len(key) == 44 and key.endswith('='):
-                return key.encode()
+            # A proper Fernet key is 32 url-safe base64-encoded bytes
+            try:
+                is_fernet_key = len(base64.urlsafe_b64decode(key)) == 32
+            except (binascii.Error, ValueError):
+                is_fernet_key = False
+            if is_fernet_key:
+                return None
             # Otherwise derive a key from the passphrase
-            return CredentialEncryption._derive_key(key)
+            return key
 
         # Fallback: derive from a combination of stable system values
         # This is less secure but allows the system to work without explicit key
-        fallback = f"viral-clips-{os.getenv('USER', 'default')}"
-        return CredentialEncryption._derive_key(fallback)
+        return f"viral-clips-{os.getenv('USER', 'default')}"
 
     @staticmethod
-    def _derive_key(passphrase: str) -> bytes:
-        """Derive a Fernet-compatible key from a passphrase."""
-        # Use SHA256 to get 32 bytes, then base64 encode for Fernet
-        digest = hashlib.sha256(passphrase.encode()).digest()
+    @lru_cache(maxsize=8)
+    def _derive_key(
+        passphrase: Union[str, bytes],
+        salt: bytes = KEY_DERIVATION_SALT,
+        iterations: int = KEY_DERIVATION_ITERATIONS,
+    ) -> bytes:
+        """
+        Derive a Fernet-compatible key from a passphrase with PBKDF2.
+        Cached because the derivation is deliberately slow.
+        """
+        if isinstance(passphrase, str):
+            passphrase = passphrase.encode()
+        digest = hashlib.pbkdf2_hmac("sha256", passphrase, salt, iterations, 32)
+        return base64.urlsafe_b64encode(digest)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _derive_legacy_key(passphrase: Union[str, bytes]) -> bytes:
+        """Derive the single-pass SHA-256 key used before PBKDF2."""
+        if isinstance(passphrase, str):
+            passphrase = passphrase.encode()
+        digest = hashlib.sha256(passphrase).digest()
         return base64.urlsafe_b64encode(digest)
 
     def encrypt(self, plaintext: str) -> str:
@@ -69,8 +164,7 @@ class CredentialEncryption:
         """
         if not plaintext:
             return ""
-        encrypted = self._fernet.encrypt(plaintext.encode())
-        return encrypted.decode()
+        return self.encrypt_bytes(plaintext.encode()).decode()
 
     def decrypt(self, ciphertext: str) -> str:
         """
@@ -87,31 +181,132 @@ class CredentialEncryption:
         """
         if not ciphertext:
             return ""
+        return self.decrypt_bytes(ciphertext.encode()).decode()
+
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """Encrypt raw bytes into a Fernet token (bytes)."""
+        return self._encrypt_token(plaintext, int(time.time()), self._mac)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        Decrypt a Fernet token (bytes) into raw bytes.
+
+        Raises:
+            ValueError: If decryption fails (wrong key or corrupted data).
+        """
+        try:
+            return self._decrypt_any(token)
+        except InvalidToken:
+            raise ValueError("Failed to decrypt: invalid key or corrupted data")
+
+    def _encrypt_token(self, data: bytes, timestamp: int, mac: HMAC) -> bytes:
+        """Build a Fernet token, copying the pre-keyed HMAC context."""
+        iv = os.urandom(_IV_SIZE)
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        padded = padder.update(data) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(self._encryption_key), modes.CBC(iv)).encryptor()
+        body = (
+            _FERNET_VERSION + struct.pack(">Q", timestamp) + iv
+            + encryptor.update(padded) + encryptor.finalize()
+        )
+        mac = mac.copy()
+        mac.update(body)
+        return base64.urlsafe_b64encode(body + mac.finalize())
+
+    def _decrypt_token(self, token: bytes, mac: HMAC) -> bytes:
+        """Verify and decrypt a Fernet token. Raises InvalidToken."""
+        try:
+            data = base64.urlsafe_b64decode(token)
+        except (TypeError, ValueError, binascii.Error):
+            raise InvalidToken
+        if len(data) < _HEADER_SIZE + _HMAC_SIZE or data[:1] != _FERNET_VERSION:
+            raise InvalidToken
+
+        body, signature = data[:-_HMAC_SIZE], data[-_HMAC_SIZE:]
+        mac = mac.copy()
+        mac.update(body)
+        try:
+            mac.verify(signature)
+        except InvalidSignature:
+            raise InvalidToken
+
+        iv = body[_HEADER_SIZE - _IV_SIZE:_HEADER_SIZE]
+        decryptor = Cipher(algorithms.AES(self._encryption_key), modes.CBC(iv)).decryptor()
+        try:
+            padded = decryptor.update(body[_HEADER_SIZE:]) + decryptor.finalize()
+            unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+            return unpadder.update(padded) + unpadder.finalize()
+        except ValueError:
+            raise InvalidToken
+
+    def _decrypt_any(self, token: bytes) -> bytes:
+        """Decrypt with the current key, falling back to the legacy key."""
+        try:
+            return self._decrypt_token(token, self._mac)
+        except InvalidToken:
+            if self._legacy is None:
+                raise
+            return self._legacy._decrypt_token(token, self._legacy._mac)
+
+    def encrypt_batch(self, plaintexts: List[str]) -> List[str]:
+        """
+        Encrypt many strings under a single timestamp.
+
+        Returns:
+            Fernet tokens in input order ("" for empty plaintexts).
+        """
+        timestamp = int(time.time())
+        return [
+            self._encrypt_token(plaintext.encode(), timestamp, self._mac).decode() if plaintext else ""
+            for plaintext in plaintexts
+        ]
+
+    def decrypt_batch(self, ciphertexts: List[str]) -> List[str]:
+        """
+        Decrypt many strings.
+
+        Raises:
+            ValueError: If any token fails to decrypt.
+        """
         try:
-            decrypted = self._fernet.decrypt(ciphertext.encode())
-            return decrypted.decode()
+            return [
+                self._decrypt_any(ciphertext.encode()).decode() if ciphertext else ""
+                for ciphertext in ciphertexts
+            ]
         except InvalidToken:
             raise ValueError("Failed to decrypt: invalid key or corrupted data")
 
     def encrypt_dict(self, data: dict) -> str:
         """Encrypt a dictionary as JSON string."""
-        import json
-        return self.encrypt(json.dumps(data))
+        return self.encrypt_bytes(_json_dumps(data)).decode()
 
     def decrypt_dict(self, ciphertext: str) -> dict:
         """Decrypt a JSON string back to dictionary."""
-        import json
-        plaintext = self.decrypt(ciphertext)
-        return json.loads(plaintext) if plaintext else {}
+        if not ciphertext:
+            return {}
+        plaintext = self.decrypt_bytes(ciphertext.encode())
+        return _json_loads(plaintext) if plaintext else {}
 
+    def encrypt_dict_many(self, items: List[dict]) -> List[str]:
+        """Encrypt many dictionaries as JSON strings."""
+        timestamp = int(time.time())
+        return [
+            self._encrypt_token(_json_dumps(data), timestamp, self._mac).decode()
+            for data in items
+        ]
 
-# Singleton instance
-_encryption: Optional[CredentialEncryption] = None
+    def decrypt_dict_many(self, ciphertexts: List[str]) -> List[dict]:
+        """Decrypt many JSON strings back to dictionaries."""
+        try:
+            return [
+                _json_loads(self._decrypt_any(ciphertext.encode())) if ciphertext else {}
+                for ciphertext in ciphertexts
+            ]
+        except InvalidToken:
+            raise ValueError("Failed to decrypt: invalid key or corrupted data")
 
 
+@lru_cache(maxsize=None)
 def get_encryption() -> CredentialEncryption:
     """Get the singleton encryption instance."""
-    global _encryption
-    if _encryption is None:
-        _encryption = CredentialEncryption()
-    return _encryption
+    return CredentialEncryption()
@@ -3,12 +3,26 @@ Data models for viral-clips-pipeline.
 Defines Video, Compilation dataclasses and status enums.
 """
 
-from dataclasses import dataclass, field
+import heapq
+import sys
+from array import array
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Type
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # Optional speedup; datetime.fromisoformat is the fallback
+    _parse_iso = datetime.fromisoformat
+
 
 class VideoStatus(Enum):
     """Video processing status."""
@@ -52,8 +66,348 @@ class UploadStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
-class Video:
+def _enum_decoder(enum_cls: Type[Enum]) -> Callable[[Any], Enum]:
+    """
+    Build a stored value -> member decoder that skips Enum.__call__.
+    Unknown values still fall through to enum_cls(value) and its ValueError.
+    """
+    members = {member.value: member for member in enum_cls}
+
+    def decode(value):
+        return members.get(value) or enum_cls(value)
+
+    return decode
+
+
+_decode_video_status = _enum_decoder(VideoStatus)
+_decode_compilation_status = _enum_decoder(CompilationStatus)
+_decode_platform = _enum_decoder(Platform)
+_decode_content_strategy = _enum_decoder(ContentStrategy)
+_decode_upload_status = _enum_decoder(UploadStatus)
+
+
+class DirtyTrackingMixin:
+    """
+    Records which fields were assigned since the object was loaded or saved.
+
+    Objects built directly (not via from_db_row) have no baseline, so
+    dirty_fields is None and every column is treated as changed.
+
+    Tracked objects also cache the stored text of serialized fields (JSON
+    lists, timestamps) until the field is reassigned, so unchanged values
+    are not re-serialized on save. For JSON lists that text is the baseline
+    that in-place changes (e.g. append) are detected against on update.
+    """
+
+    __slots__ = ("_dirty", "_serialized")
+
+    # JSON list fields, registered by _lazy_json_lists
+    _JSON_FIELDS: Tuple[str, ...] = ()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        dirty = getattr(self, "_dirty", None)
+        if dirty is not None:
+            dirty.add(name)
+            cache = getattr(self, "_serialized", None)
+            if cache is not None:
+                cache.pop(name, None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Field values only; copies and unpickled objects start untracked."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __copy__(self):
+        clone = object.__new__(type(self))
+        clone.__setstate__(self.__getstate__())
+        return clone
+
+    @property
+    def dirty_fields(self) -> Optional[Set[str]]:
+        """Fields assigned since the last mark_clean(), or None if untracked."""
+        return getattr(self, "_dirty", None)
+
+    def mark_clean(self, stored_text: Optional[Dict[str, str]] = None) -> None:
+        """
+        Reset dirty tracking after the object matches its database row.
+        stored_text seeds the serialized-field cache with columns as stored.
+        """
+        object.__setattr__(self, "_dirty", set())
+        if getattr(self, "_serialized", None) is None:
+            object.__setattr__(self, "_serialized", {})
+        if stored_text:
+            self._serialized.update(stored_text)
+        # Baseline for detecting in-place list changes
+        for name in self._JSON_FIELDS:
+            text = self._json_field_text(name)
+            if text is not None:
+                self._serialized[name] = text
+
+    def _json_field_text(self, name: str) -> Optional[str]:
+        """Current JSON text of a list field, or None while it is still unparsed."""
+        value = type(self).__dict__[name].slot.__get__(self)
+        return None if value is _UNPARSED else _json_dumps(value)
+
+    def changed_json_fields(self) -> Dict[str, str]:
+        """
+        JSON list fields mutated in place since the last mark_clean(), mapped
+        to their current text. Reassigned fields are in dirty_fields instead.
+        """
+        cache = getattr(self, "_serialized", None)
+        if cache is None:
+            return {}
+        changed = {}
+        for name in self._JSON_FIELDS:
+            if name in self._dirty:
+                continue
+            text = self._json_field_text(name)
+            if text is not None and text != cache.get(name):
+                changed[name] = text
+        return changed
+
+    def _serialize_field(self, name: str, serialize: Callable[[Any], str]) -> str:
+        """Serialize a field, reusing the cached text while tracked."""
+        cache = getattr(self, "_serialized", None)
+        if cache is None:
+            return serialize(getattr(self, name))
+        if name in self._JSON_FIELDS:
+            # A parsed list may have changed in place, so only unparsed text is reused
+            text = self._json_field_text(name)
+            return cache[name] if text is None else text
+        text = cache.get(name)
+        if text is None:
+            text = cache[name] = serialize(getattr(self, name))
+        return text
+
+
+# JSON codecs for list columns, chosen once at import
+if orjson is not None:
+    _orjson_dumps = orjson.dumps
+
+    def _json_dumps(value) -> str:
+        """Serialize a list column to JSON text."""
+        return _orjson_dumps(value).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+def _intern_text(value):
+    """
+    Intern a low-cardinality text column (category, privacy, ...), so rows
+    share one string per value and compare by identity first.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Parse a stored timestamp; empty values become None."""
+    # sqlite3 hands back exact str, so an identity check covers the hot path
+    if value.__class__ is str:
+        return _parse_iso(value) if value else None
+    if isinstance(value, datetime):
+        return value
+    return None
+
+
+def _parse_created_at(value) -> datetime:
+    """Parse a stored created_at, defaulting to now when missing."""
+    if value.__class__ is str and value:
+        return _parse_iso(value)
+    return _parse_timestamp(value) or datetime.now()
+
+
+def _parse_json_list(value) -> list:
+    """Parse a stored JSON list column."""
+    # Uncaptioned compilations store "[]" for two of their three lists
+    if not value or value == "[]":
+        return []
+    return _json_loads(value)
+
+
+# Slot value of a lazy JSON list whose stored text has not been parsed yet
+_UNPARSED = object()
+
+
+class _LazyJsonList:
+    """
+    Wraps the slot of a JSON list field on a dirty-tracked model so rows
+    loaded from the database parse the stored text on first read only.
+    Until then the text lives in the serialized-field cache, which is also
+    what gets written back if the field is never touched.
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: MemberDescriptorType):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if value is _UNPARSED:
+            value = _parse_json_list(obj._serialized[self.name])
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _lazy_json_lists(cls, *names: str):
+    """Install _LazyJsonList wrappers over the slots of cls's JSON list fields."""
+    for name in names:
+        setattr(cls, name, _LazyJsonList(name, cls.__dict__[name]))
+    cls._JSON_FIELDS = cls._JSON_FIELDS + names
+    return cls
+
+
+# Decoders whose stored text round-trips exactly, so it can seed the
+# serialized-field cache of dirty-tracked models
+_TEXT_DECODERS = (_parse_json_list, _parse_created_at)
+
+# (model class, column names) -> generated row builder
+_ROW_PLANS: Dict[Tuple[type, Tuple[str, ...]], Callable[[tuple], Any]] = {}
+
+
+def _compile_row_builder(cls, columns: Tuple[str, ...]) -> Callable[[tuple], Any]:
+    """
+    Generate a straight-line constructor for one result shape.
+
+    Column indexes, decoders and defaults are bound into the generated
+    function, so hydrating a row runs no per-field loop or lookup. Slotted
+    fields are written through their slot descriptors, bypassing __init__
+    and any __setattr__ override. Dirty-tracked models come out clean, with
+    the stored text of their serialized columns already cached.
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    decoders = cls._DB_DECODERS
+    namespace = {"_new": cls.__new__, "_cls": cls, "_setattr": object.__setattr__}
+    lines = ["def build(row):", "    obj = _new(_cls)"]
+    text_columns = []
+    empty_json_columns = []
+    for f in fields(cls):
+        name = f.name
+        if name in index:
+            i = index[name]
+            decode = decoders.get(name)
+            if decode is None:
+                value = f"row[{i}]"
+            else:
+                namespace[f"_decode_{name}"] = decode
+                value = f"_decode_{name}(row[{i}])"
+                if decode in _TEXT_DECODERS:
+                    text_columns.append((i, name))
+        elif f.default_factory is not MISSING:
+            namespace[f"_default_{name}"] = f.default_factory
+            value = f"_default_{name}()"
+        else:
+            namespace[f"_default_{name}"] = f.default
+            value = f"_default_{name}"
+
+        descriptor = cls.__dict__.get(name)
+        if isinstance(descriptor, _LazyJsonList):
+            if name in index:
+                # Leave the text in the serialized cache until first read
+                value = f"_UNPARSED if row[{i}] and isinstance(row[{i}], str) else []"
+                namespace["_UNPARSED"] = _UNPARSED
+                empty_json_columns.append((i, name))
+            descriptor = descriptor.slot
+        if isinstance(descriptor, MemberDescriptorType):
+            namespace[f"_set_{name}"] = descriptor.__set__
+            lines.append(f"    _set_{name}(obj, {value})")
+        else:
+            lines.append(f"    _setattr(obj, {name!r}, {value})")
+    if issubclass(cls, DirtyTrackingMixin):
+        # Inlined mark_clean(stored_text)
+        lines.append("    _setattr(obj, '_dirty', set())")
+        lines.append("    serialized = {}")
+        for i, name in text_columns:
+            lines.append(f"    if row[{i}] and isinstance(row[{i}], str):")
+            lines.append(f"        serialized[{name!r}] = row[{i}]")
+            if (i, name) in empty_json_columns:
+                # Empty lists compare against "[]" so they aren't rewritten
+                lines.append("    else:")
+                lines.append(f"        serialized[{name!r}] = '[]'")
+        lines.append("    _setattr(obj, '_serialized', serialized)")
+    lines.append("    return obj")
+
+    code = compile("\n".join(lines), f"<{cls.__name__} row builder>", "exec")
+    exec(code, namespace)
+    return namespace["build"]
+
+
+def _row_plan(cls, columns: Tuple[str, ...]) -> Callable[[tuple], Any]:
+    """Get the row builder for a result set's column order, compiled once per shape."""
+    key = (cls, columns)
+    plan = _ROW_PLANS.get(key)
+    if plan is None:
+        plan = _ROW_PLANS[key] = _compile_row_builder(cls, columns)
+    return plan
+
+
+def _from_row_tuple(cls, columns: Tuple[str, ...], row: tuple):
+    """
+    Build a model from a plain result tuple without going through __init__.
+    Values are decoded with cls._DB_DECODERS and assigned positionally.
+    """
+    return _row_plan(cls, columns)(row)
+
+
+def _from_row_tuples(cls, columns: Tuple[str, ...], rows: Iterable[tuple]) -> list:
+    """Build models from many result tuples, looking up the row builder once."""
+    build = _row_plan(cls, columns)
+    return [build(row) for row in rows]
+
+
+def _row_values(row: Mapping[str, Any]) -> Tuple[Tuple[str, ...], tuple]:
+    """Split a mapping row (e.g. sqlite3.Row) into column names and values."""
+    columns = tuple(row.keys())
+    return columns, tuple(row[name] for name in columns)
+
+
+# Column order of to_db_values()/to_db_dict()
+_VIDEO_DB_FIELDS = (
+    "id", "tiktok_id", "url", "description", "author", "hashtags", "plays",
+    "likes", "shares", "status", "local_path", "duration", "width", "height",
+    "category", "subcategory", "category_confidence",
+    "classification_reasoning", "compilation_score", "visual_independence",
+    "is_source_compilation", "source_clip_count", "compilation_type",
+    "compilation_id", "clip_order", "caption", "error", "retry_count",
+    "created_at",
+)
+
+_COMPILATION_DB_FIELDS = (
+    "id", "category", "title", "description", "video_ids", "status",
+    "output_path", "duration", "music_track", "youtube_id", "credits_text",
+    "auto_approved", "confidence_score", "hook", "clip_captions",
+    "transitions", "end_card", "error", "created_at",
+)
+
+_UPLOAD_DB_FIELDS = (
+    "id", "compilation_id", "account_id", "platform", "status",
+    "platform_video_id", "privacy", "scheduled_at", "uploaded_at", "error",
+    "retry_count", "created_at",
+)
+
+_REDDIT_POST_DB_FIELDS = (
+    "id", "reddit_id", "subreddit", "title", "body", "author", "upvotes",
+    "upvote_ratio", "num_comments", "word_count", "estimated_duration",
+    "status", "audio_path", "word_timings", "video_id", "error",
+    "reddit_created_at", "created_at",
+)
+
+
+@dataclass(slots=True)
+class Video(DirtyTrackingMixin):
     """Represents a TikTok video in the pipeline."""
 
     # Identifiers
@@ -103,6 +457,28 @@ class Video:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    DB_FIELDS = _VIDEO_DB_FIELDS
+
+    _DB_DECODERS = {
+        "hashtags": _parse_json_list,
+        "status": _decode_video_status,
+        "category": _intern_text,
+        "subcategory": _intern_text,
+        "compilation_type": _intern_text,
+        "is_source_compilation": bool,
+        "created_at": _parse_created_at,
+    }
+
+    @classmethod
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "Video":
+        """Create Video from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
+
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["Video"]:
+        """Create many Videos from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
+
     @property
     def engagement_score(self) -> int:
         """Calculate engagement score for ranking."""
@@ -111,88 +487,139 @@ class Video:
     @property
     def hashtags_json(self) -> str:
         """Serialize hashtags to JSON string."""
-        return json.dumps(self.hashtags)
+        return self._serialize_field("hashtags", _json_dumps)
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "Video":
+    def from_db_row(cls, row: Mapping[str, Any]) -> "Video":
         """Create Video from database row."""
-        hashtags = json.loads(row.get("hashtags", "[]"))
-        status = VideoStatus(row.get("status", "discovered"))
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-
-        return cls(
-            id=row["id"],
-            tiktok_id=row.get("tiktok_id", ""),
-            url=row.get("url", ""),
-            description=row.get("description", ""),
-            author=row.get("author", ""),
-            hashtags=hashtags,
-            plays=row.get("plays", 0),
-            likes=row.get("likes", 0),
-            shares=row.get("shares", 0),
-            status=status,
-            local_path=row.get("local_path", ""),
-            duration=row.get("duration", 0.0),
-            width=row.get("width", 0),
-            height=row.get("height", 0),
-            category=row.get("category", ""),
-            subcategory=row.get("subcategory", ""),
-            category_confidence=row.get("category_confidence", 0.0),
-            classification_reasoning=row.get("classification_reasoning", ""),
-            compilation_score=row.get("compilation_score", 0.0),
-            visual_independence=row.get("visual_independence", 0.0),
-            is_source_compilation=bool(row.get("is_source_compilation", False)),
-            source_clip_count=row.get("source_clip_count", 0),
-            compilation_type=row.get("compilation_type", ""),
-            compilation_id=row.get("compilation_id", ""),
-            clip_order=row.get("clip_order", 0),
-            caption=row.get("caption", ""),
-            error=row.get("error", ""),
-            retry_count=row.get("retry_count", 0),
-            created_at=created_at,
+        return cls.from_row_tuple(*_row_values(row))
+
+    def to_db_values(self) -> tuple:
+        """Column values in DB_FIELDS order, for inserts that skip the dict."""
+        # Enum columns read _value_, the plain member attribute behind the
+        # (much slower) Enum.value property
+        return (
+            self.id,
+            self.tiktok_id,
+            self.url,
+            self.description,
+            self.author,
+            self.hashtags_json,
+            self.plays,
+            self.likes,
+            self.shares,
+            self.status._value_,
+            self.local_path,
+            self.duration,
+            self.width,
+            self.height,
+            self.category,
+            self.subcategory,
+            self.category_confidence,
+            self.classification_reasoning,
+            self.compilation_score,
+            self.visual_independence,
+            self.is_source_compilation,
+            self.source_clip_count,
+            self.compilation_type,
+            self.compilation_id,
+            self.clip_order,
+            self.caption,
+            self.error,
+            self.retry_count,
+            self._serialize_field("created_at", datetime.isoformat),
         )
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "tiktok_id": self.tiktok_id,
-            "url": self.url,
-            "description": self.description,
-            "author": self.author,
-            "hashtags": self.hashtags_json,
-            "plays": self.plays,
-            "likes": self.likes,
-            "shares": self.shares,
-            "status": self.status.value,
-            "local_path": self.local_path,
-            "duration": self.duration,
-            "width": self.width,
-            "height": self.height,
-            "category": self.category,
-            "subcategory": self.subcategory,
-            "category_confidence": self.category_confidence,
-            "classification_reasoning": self.classification_reasoning,
-            "compilation_score": self.compilation_score,
-            "visual_independence": self.visual_independence,
-            "is_source_compilation": int(self.is_source_compilation),
-            "source_clip_count": self.source_clip_count,
-            "compilation_type": self.compilation_type,
-            "compilation_id": self.compilation_id,
-            "clip_order": self.clip_order,
-            "caption": self.caption,
-            "error": self.error,
-            "retry_count": self.retry_count,
-            "created_at": self.created_at.isoformat(),
-        }
+        return dict(zip(self.DB_FIELDS, self.to_db_values()))
+
+
+_lazy_json_lists(Video, "hashtags")
+
+
+def _engagement_key(video: "Video") -> int:
+    """Sort key equivalent to Video.engagement_score, without the property call."""
+    return video.likes + (video.shares * 2)
+
+
+def rank_videos(
+    videos: Iterable["Video"],
+    k: int,
+    key: Optional[Callable[["Video"], Any]] = None,
+) -> List["Video"]:
+    """
+    Get the k highest-ranked videos, best first.
+
+    Same result as sorted(videos, key=key, reverse=True)[:k] (ties keep
+    input order), but a bounded heap makes it O(N log k) instead of O(N log N).
+    Ranks by engagement score unless another key is given.
+    """
+    return heapq.nlargest(k, videos, key=key or _engagement_key)
+
+
+# Compact column types for VideoBatch; counters are clipped to fit
+_INT32_MAX = 2**31 - 1
+_UINT8_MAX = 255
+_VIDEO_STATUSES = tuple(VideoStatus)
+_VIDEO_STATUS_CODES = {status: code for code, status in enumerate(_VIDEO_STATUSES)}
+
+
+@dataclass(slots=True)
+class VideoBatch:
+    """
+    Columnar view of many videos for ranking and filtering sweeps.
+
+    Numeric fields are packed into the smallest typed arrays that hold them
+    (int32 likes/shares, uint8 status/retries, float32 scores and durations)
+    so a pass over one column touches as few bytes as possible; results map
+    back to videos by row index.
+    """
+
+    videos: List[Video]
+    plays: array                 # int64: play counts can pass 2**31
+    likes: array                 # int32
+    shares: array                # int32
+    retry_count: array           # uint8
+    status: array                # uint8 index into VideoStatus
+    category_confidence: array   # float32
+    duration: array              # float32
+
+    @classmethod
+    def from_videos(cls, videos: Iterable[Video]) -> "VideoBatch":
+        """Build the columns from the videos, clipping counters to their type."""
+        videos = list(videos)
+        return cls(
+            videos=videos,
+            plays=array("q", [v.plays for v in videos]),
+            likes=array("i", [min(v.likes, _INT32_MAX) for v in videos]),
+            shares=array("i", [min(v.shares, _INT32_MAX) for v in videos]),
+            retry_count=array("B", [min(v.retry_count, _UINT8_MAX) for v in videos]),
+            status=array("B", [_VIDEO_STATUS_CODES[v.status] for v in videos]),
+            category_confidence=array("f", [v.category_confidence for v in videos]),
+            duration=array("f", [v.duration for v in videos]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.videos)
+
+    def status_at(self, index: int) -> VideoStatus:
+        """Decode the status stored for a row."""
+        return _VIDEO_STATUSES[self.status[index]]
 
+    def engagement_scores(self) -> List[int]:
+        """Engagement score of every row, as Video.engagement_score computes it."""
+        return [likes + (shares * 2) for likes, shares in zip(self.likes, self.shares)]
 
-@dataclass
-class Compilation:
+    def top(self, k: int) -> List[Video]:
+        """Get the k most engaging videos, best first (ties keep input order)."""
+        scores = self.engagement_scores()
+        best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        return [self.videos[i] for i in best]
+
+
+@dataclass(slots=True)
+class Compilation(DirtyTrackingMixin):
     """Represents a compilation of videos."""
 
     id: str                              # UUID
@@ -227,82 +654,81 @@ class Compilation:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    DB_FIELDS = _COMPILATION_DB_FIELDS
+
     @property
     def video_ids_json(self) -> str:
         """Serialize video_ids to JSON string."""
-        return json.dumps(self.video_ids)
+        return self._serialize_field("video_ids", _json_dumps)
 
     @property
     def clip_captions_json(self) -> str:
         """Serialize clip_captions to JSON string."""
-        return json.dumps(self.clip_captions)
+        return self._serialize_field("clip_captions", _json_dumps)
 
     @property
     def transitions_json(self) -> str:
         """Serialize transitions to JSON string."""
-        return json.dumps(self.transitions)
+        return self._serialize_field("transitions", _json_dumps)
+
+    _DB_DECODERS = {
+        "category": _intern_text,
+        "video_ids": _parse_json_list,
+        "status": _decode_compilation_status,
+        "auto_approved": bool,
+        "clip_captions": _parse_json_list,
+        "transitions": _parse_json_list,
+        "created_at": _parse_created_at,
+    }
 
     @classmethod
-    def from_db_row(cls, row: dict) -> "Compilation":
-        """Create Compilation from database row."""
-        video_ids = json.loads(row.get("video_ids", "[]"))
-        clip_captions = json.loads(row.get("clip_captions", "[]"))
-        transitions = json.loads(row.get("transitions", "[]"))
-        status = CompilationStatus(row.get("status", "pending"))
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "Compilation":
+        """Create Compilation from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        return cls(
-            id=row["id"],
-            category=row.get("category", ""),
-            title=row.get("title", ""),
-            description=row.get("description", ""),
-            video_ids=video_ids,
-            status=status,
-            output_path=row.get("output_path", ""),
-            duration=row.get("duration", 0.0),
-            music_track=row.get("music_track", ""),
-            youtube_id=row.get("youtube_id", ""),
-            credits_text=row.get("credits_text", ""),
-            auto_approved=bool(row.get("auto_approved", False)),
-            confidence_score=row.get("confidence_score", 0.0),
-            hook=row.get("hook", ""),
-            clip_captions=clip_captions,
-            transitions=transitions,
-            end_card=row.get("end_card", ""),
-            error=row.get("error", ""),
-            created_at=created_at,
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["Compilation"]:
+        """Create many Compilations from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
+
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "Compilation":
+        """Create Compilation from database row."""
+        return cls.from_row_tuple(*_row_values(row))
+
+    def to_db_values(self) -> tuple:
+        """Column values in DB_FIELDS order, for inserts that skip the dict."""
+        return (
+            self.id,
+            self.category,
+            self.title,
+            self.description,
+            self.video_ids_json,
+            self.status._value_,
+            self.output_path,
+            self.duration,
+            self.music_track,
+            self.youtube_id,
+            self.credits_text,
+            self.auto_approved,
+            self.confidence_score,
+            self.hook,
+            self.clip_captions_json,
+            self.transitions_json,
+            self.end_card,
+            self.error,
+            self._serialize_field("created_at", datetime.isoformat),
         )
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "category": self.category,
-            "title": self.title,
-            "description": self.description,
-            "video_ids": self.video_ids_json,
-            "status": self.status.value,
-            "output_path": self.output_path,
-            "duration": self.duration,
-            "music_track": self.music_track,
-            "youtube_id": self.youtube_id,
-            "credits_text": self.credits_text,
-            "auto_approved": int(self.auto_approved),
-            "confidence_score": self.confidence_score,
-            "hook": self.hook,
-            "clip_captions": self.clip_captions_json,
-            "transitions": self.transitions_json,
-            "end_card": self.end_card,
-            "error": self.error,
-            "created_at": self.created_at.isoformat(),
-        }
+        return dict(zip(self.DB_FIELDS, self.to_db_values()))
+
 
+_lazy_json_lists(Compilation, "video_ids", "clip_captions", "transitions")
 
-@dataclass
+
+@dataclass(slots=True)
 class Account:
     """Represents a platform account for uploading."""
 
@@ -329,58 +755,48 @@ class Account:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    _DB_DECODERS = {
+        "platform": _decode_platform,
+        "content_strategy": _decode_content_strategy,
+        "last_upload_at": _parse_timestamp,
+        "is_active": bool,
+        "created_at": _parse_created_at,
+    }
+
     @classmethod
-    def from_db_row(cls, row: dict) -> "Account":
-        """Create Account from database row."""
-        platform = Platform(row.get("platform", "youtube"))
-        content_strategy = ContentStrategy(row.get("content_strategy", "mixed"))
-
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-
-        last_upload_at = row.get("last_upload_at")
-        if isinstance(last_upload_at, str) and last_upload_at:
-            last_upload_at = datetime.fromisoformat(last_upload_at)
-        else:
-            last_upload_at = None
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "Account":
+        """Create Account from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        return cls(
-            id=row["id"],
-            platform=platform,
-            name=row.get("name", ""),
-            handle=row.get("handle", ""),
-            content_strategy=content_strategy,
-            credentials_encrypted=row.get("credentials_encrypted", ""),
-            daily_upload_limit=row.get("daily_upload_limit", 6),
-            uploads_today=row.get("uploads_today", 0),
-            last_upload_at=last_upload_at,
-            is_active=bool(row.get("is_active", True)),
-            error=row.get("error", ""),
-            created_at=created_at,
-        )
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["Account"]:
+        """Create many Accounts from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
+
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "Account":
+        """Create Account from database row."""
+        return cls.from_row_tuple(*_row_values(row))
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
         return {
             "id": self.id,
-            "platform": self.platform.value,
+            "platform": self.platform._value_,
             "name": self.name,
             "handle": self.handle,
-            "content_strategy": self.content_strategy.value,
+            "content_strategy": self.content_strategy._value_,
             "credentials_encrypted": self.credentials_encrypted,
             "daily_upload_limit": self.daily_upload_limit,
             "uploads_today": self.uploads_today,
             "last_upload_at": self.last_upload_at.isoformat() if self.last_upload_at else None,
-            "is_active": int(self.is_active),
+            "is_active": self.is_active,
             "error": self.error,
             "created_at": self.created_at.isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Upload:
     """Represents an upload job for a compilation to a platform account."""
 
@@ -405,64 +821,55 @@ class Upload:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    DB_FIELDS = _UPLOAD_DB_FIELDS
+
+    _DB_DECODERS = {
+        "platform": _decode_platform,
+        "status": _decode_upload_status,
+        "privacy": _intern_text,
+        "scheduled_at": _parse_timestamp,
+        "uploaded_at": _parse_timestamp,
+        "created_at": _parse_created_at,
+    }
+
     @classmethod
-    def from_db_row(cls, row: dict) -> "Upload":
-        """Create Upload from database row."""
-        platform = Platform(row.get("platform", "youtube"))
-        status = UploadStatus(row.get("status", "pending"))
-
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-
-        scheduled_at = row.get("scheduled_at")
-        if isinstance(scheduled_at, str) and scheduled_at:
-            scheduled_at = datetime.fromisoformat(scheduled_at)
-        else:
-            scheduled_at = None
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "Upload":
+        """Create Upload from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        uploaded_at = row.get("uploaded_at")
-        if isinstance(uploaded_at, str) and uploaded_at:
-            uploaded_at = datetime.fromisoformat(uploaded_at)
-        else:
-            uploaded_at = None
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["Upload"]:
+        """Create many Uploads from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
 
-        return cls(
-            id=row["id"],
-            compilation_id=row.get("compilation_id", ""),
-            account_id=row.get("account_id", ""),
-            platform=platform,
-            status=status,
-            platform_video_id=row.get("platform_video_id", ""),
-            privacy=row.get("privacy", "private"),
-            scheduled_at=scheduled_at,
-            uploaded_at=uploaded_at,
-            error=row.get("error", ""),
-            retry_count=row.get("retry_count", 0),
-            created_at=created_at,
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "Upload":
+        """Create Upload from database row."""
+        return cls.from_row_tuple(*_row_values(row))
+
+    def to_db_values(self) -> tuple:
+        """Column values in DB_FIELDS order, for inserts that skip the dict."""
+        return (
+            self.id,
+            self.compilation_id,
+            self.account_id,
+            self.platform._value_,
+            self.status._value_,
+            self.platform_video_id,
+            self.privacy,
+            self.scheduled_at.isoformat() if self.scheduled_at else None,
+            self.uploaded_at.isoformat() if self.uploaded_at else None,
+            self.error,
+            self.retry_count,
+            self.created_at.isoformat(),
         )
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "compilation_id": self.compilation_id,
-            "account_id": self.account_id,
-            "platform": self.platform.value,
-            "status": self.status.value,
-            "platform_video_id": self.platform_video_id,
-            "privacy": self.privacy,
-            "scheduled_at": self.scheduled_at.isoformat() if self.scheduled_at else None,
-            "uploaded_at": self.uploaded_at.isoformat() if self.uploaded_at else None,
-            "error": self.error,
-            "retry_count": self.retry_count,
-            "created_at": self.created_at.isoformat(),
-        }
+        return dict(zip(self.DB_FIELDS, self.to_db_values()))
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingRule:
     """Defines content routing rules for accounts."""
 
@@ -475,23 +882,25 @@ class RoutingRule:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    _DB_DECODERS = {
+        "category": _intern_text,
+        "created_at": _parse_created_at,
+    }
+
     @classmethod
-    def from_db_row(cls, row: dict) -> "RoutingRule":
-        """Create RoutingRule from database row."""
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "RoutingRule":
+        """Create RoutingRule from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        return cls(
-            id=row["id"],
-            account_id=row.get("account_id", ""),
-            category=row.get("category", ""),
-            min_confidence=row.get("min_confidence", 0.7),
-            priority=row.get("priority", 1),
-            created_at=created_at,
-        )
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["RoutingRule"]:
+        """Create many RoutingRules from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
+
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "RoutingRule":
+        """Create RoutingRule from database row."""
+        return cls.from_row_tuple(*_row_values(row))
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
@@ -527,8 +936,12 @@ class RedditVideoStatus(Enum):
     REJECTED = "rejected"          # Manually rejected
 
 
-@dataclass
-class RedditPost:
+_decode_reddit_post_status = _enum_decoder(RedditPostStatus)
+_decode_reddit_video_status = _enum_decoder(RedditVideoStatus)
+
+
+@dataclass(slots=True)
+class RedditPost(DirtyTrackingMixin):
     """Represents a Reddit story post for narration."""
 
     # Identifiers
@@ -565,80 +978,72 @@ class RedditPost:
     reddit_created_at: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.now)
 
+    DB_FIELDS = _REDDIT_POST_DB_FIELDS
+
     @property
     def word_timings_json(self) -> str:
         """Serialize word_timings to JSON string."""
-        return json.dumps(self.word_timings)
+        return self._serialize_field("word_timings", _json_dumps)
 
     @property
     def full_text(self) -> str:
         """Get full text for TTS (title + body)."""
         return f"{self.title}\n\n{self.body}"
 
+    _DB_DECODERS = {
+        "status": _decode_reddit_post_status,
+        "word_timings": _parse_json_list,
+        "reddit_created_at": _parse_timestamp,
+        "created_at": _parse_created_at,
+    }
+
     @classmethod
-    def from_db_row(cls, row: dict) -> "RedditPost":
-        """Create RedditPost from database row."""
-        word_timings = json.loads(row.get("word_timings", "[]"))
-        status = RedditPostStatus(row.get("status", "discovered"))
-
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-
-        reddit_created_at = row.get("reddit_created_at")
-        if isinstance(reddit_created_at, str) and reddit_created_at:
-            reddit_created_at = datetime.fromisoformat(reddit_created_at)
-        else:
-            reddit_created_at = None
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "RedditPost":
+        """Create RedditPost from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        return cls(
-            id=row["id"],
-            reddit_id=row.get("reddit_id", ""),
-            subreddit=row.get("subreddit", ""),
-            title=row.get("title", ""),
-            body=row.get("body", ""),
-            author=row.get("author", ""),
-            upvotes=row.get("upvotes", 0),
-            upvote_ratio=row.get("upvote_ratio", 0.0),
-            num_comments=row.get("num_comments", 0),
-            word_count=row.get("word_count", 0),
-            estimated_duration=row.get("estimated_duration", 0.0),
-            status=status,
-            audio_path=row.get("audio_path", ""),
-            word_timings=word_timings,
-            video_id=row.get("video_id", ""),
-            error=row.get("error", ""),
-            reddit_created_at=reddit_created_at,
-            created_at=created_at,
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["RedditPost"]:
+        """Create many RedditPosts from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
+
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "RedditPost":
+        """Create RedditPost from database row."""
+        return cls.from_row_tuple(*_row_values(row))
+
+    def to_db_values(self) -> tuple:
+        """Column values in DB_FIELDS order, for inserts that skip the dict."""
+        return (
+            self.id,
+            self.reddit_id,
+            self.subreddit,
+            self.title,
+            self.body,
+            self.author,
+            self.upvotes,
+            self.upvote_ratio,
+            self.num_comments,
+            self.word_count,
+            self.estimated_duration,
+            self.status._value_,
+            self.audio_path,
+            self.word_timings_json,
+            self.video_id,
+            self.error,
+            self.reddit_created_at.isoformat() if self.reddit_created_at else None,
+            self.created_at.isoformat(),
         )
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "reddit_id": self.reddit_id,
-            "subreddit": self.subreddit,
-            "title": self.title,
-            "body": self.body,
-            "author": self.author,
-            "upvotes": self.upvotes,
-            "upvote_ratio": self.upvote_ratio,
-            "num_comments": self.num_comments,
-            "word_count": self.word_count,
-            "estimated_duration": self.estimated_duration,
-            "status": self.status.value,
-            "audio_path": self.audio_path,
-            "word_timings": self.word_timings_json,
-            "video_id": self.video_id,
-            "error": self.error,
-            "reddit_created_at": self.reddit_created_at.isoformat() if self.reddit_created_at else None,
-            "created_at": self.created_at.isoformat(),
-        }
+        return dict(zip(self.DB_FIELDS, self.to_db_values()))
+
 
+_lazy_json_lists(RedditPost, "word_timings")
 
-@dataclass
+
+@dataclass(slots=True)
 class RedditVideo:
     """Represents a composed Reddit narration video."""
 
@@ -667,31 +1072,25 @@ class RedditVideo:
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
 
+    _DB_DECODERS = {
+        "status": _decode_reddit_video_status,
+        "created_at": _parse_created_at,
+    }
+
     @classmethod
-    def from_db_row(cls, row: dict) -> "RedditVideo":
-        """Create RedditVideo from database row."""
-        status = RedditVideoStatus(row.get("status", "pending"))
+    def from_row_tuple(cls, columns: Sequence[str], row: tuple) -> "RedditVideo":
+        """Create RedditVideo from a plain result tuple and its column names."""
+        return _from_row_tuple(cls, tuple(columns), row)
 
-        created_at = row.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
+    @classmethod
+    def from_row_tuples(cls, columns: Sequence[str], rows: Iterable[tuple]) -> List["RedditVideo"]:
+        """Create many RedditVideos from plain result tuples sharing one column order."""
+        return _from_row_tuples(cls, tuple(columns), rows)
 
-        return cls(
-            id=row["id"],
-            post_id=row.get("post_id", ""),
-            title=row.get("title", ""),
-            description=row.get("description", ""),
-            duration=row.get("duration", 0.0),
-            output_path=row.get("output_path", ""),
-            background_used=row.get("background_used", ""),
-            status=status,
-            youtube_id=row.get("youtube_id", ""),
-            tiktok_id=row.get("tiktok_id", ""),
-            error=row.get("error", ""),
-            created_at=created_at,
-        )
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "RedditVideo":
+        """Create RedditVideo from database row."""
+        return cls.from_row_tuple(*_row_values(row))
 
     def to_db_dict(self) -> dict:
         """Convert to dictionary for database storage."""
@@ -703,7 +1102,7 @@ class RedditVideo:
             "duration": self.duration,
             "output_path": self.output_path,
             "background_used": self.background_used,
-            "status": self.status.value,
+            "status": self.status._value_,
             "youtube_id": self.youtube_id,
             "tiktok_id": self.tiktok_id,
             "error": self.error,
@@ -10,9 +10,13 @@ Usage:
 """
 
 import argparse
+import json
 import logging
+import os
 import signal
 import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -30,6 +34,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("daemon")
 
+# --status output is cached on disk so repeated invocations (e.g. under
+# `watch`) don't rerun every aggregate query
+STATUS_CACHE_TTL = 5.0
+
 
 class PipelineDaemon:
     """Manages the pipeline scheduler as a daemon process."""
@@ -39,13 +47,13 @@ class PipelineDaemon:
         self.scheduler = PipelineScheduler()
         self.aggressive = aggressive
         self.mega = mega
-        self._running = False
+        self._stop_event = threading.Event()
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
-        self._running = False
         self.scheduler.stop()
+        self._stop_event.set()
 
     def start(self):
         """Start the daemon."""
@@ -73,7 +81,6 @@ class PipelineDaemon:
 
         # Start scheduler first (needed for next_run_time to be available)
         self.scheduler.start()
-        self._running = True
 
         # Print job schedule (after scheduler starts)
         logger.info("-" * 60)
@@ -85,10 +92,9 @@ class PipelineDaemon:
 
         logger.info("Daemon started. Press Ctrl+C to stop.")
 
-        # Main loop
+        # Block until a shutdown signal arrives; no periodic wakeups
         try:
-            while self._running:
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             pass
 
@@ -250,44 +256,111 @@ Examples:
     return 0
 
 
+def _status_cache_path() -> Path:
+    """Location of the on-disk --status cache, next to the database."""
+    return settings.DATABASE_PATH.parent / "status_cache.json"
+
+
+def _load_status_cache(ttl: float) -> dict:
+    """Return cached status results, or {} if the cache is missing or stale."""
+    path = _status_cache_path()
+    try:
+        if path.stat().st_mtime < time.time() - ttl:
+            return {}
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_status_cache(cache: dict) -> None:
+    """Write status results atomically; failures only cost a recompute."""
+    path = _status_cache_path()
+    try:
+        # A unique temp file per writer, so concurrent --status runs can't
+        # publish each other's partial writes
+        tmp = tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=".status_cache.", suffix=".tmp", delete=False
+        )
+    except OSError as e:
+        logger.debug(f"Could not write status cache: {e}")
+        return
+    try:
+        with tmp:
+            json.dump(cache, tmp)
+        os.replace(tmp.name, path)
+    except OSError as e:
+        logger.debug(f"Could not write status cache: {e}")
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+
+
+def _cached(cache: dict, key: str, fn):
+    """Return cache[key], computing and storing it with fn() on a miss."""
+    if key not in cache:
+        cache[key] = fn()
+    return cache[key]
+
+
 def show_status():
     """Show current pipeline status."""
-    from core.database import Database
-    from core.models import VideoStatus, CompilationStatus, UploadStatus
-
-    db = Database(settings.DATABASE_PATH)
+    from core.database import get_database
+    from core.models import VideoStatus, CompilationStatus
+
+    cache = _load_status_cache(STATUS_CACHE_TTL)
+    fresh = bool(cache)
+    db = None
+    am = None
+
+    # Database and services are only built if something must be recomputed
+    def get_db():
+        nonlocal db
+        if db is None:
+            db = get_database(settings.DATABASE_PATH)
+        return db
+
+    def get_account_manager():
+        nonlocal am
+        if am is None:
+            from services.account_manager import AccountManager
+            am = AccountManager(get_db())
+        return am
+
+    def get_upload_stats():
+        from services.upload_router import UploadRouter
+        return UploadRouter(get_db(), get_account_manager()).get_upload_stats()
 
     print("\n" + "=" * 60)
     print("PIPELINE STATUS")
     print("=" * 60)
 
     # Video stats
-    video_counts = db.count_videos_by_status()
+    video_counts = _cached(cache, "count_videos_by_status", lambda: get_db().count_videos_by_status())
     print("\nVideos:")
     for status in VideoStatus:
         count = video_counts.get(status.value, 0)
         print(f"  {status.value:15} {count:5}")
 
     # Compilation stats
-    comp_counts = db.count_compilations_by_status()
+    comp_counts = _cached(
+        cache, "count_compilations_by_status", lambda: get_db().count_compilations_by_status()
+    )
     print("\nCompilations:")
     for status in CompilationStatus:
         count = comp_counts.get(status.value, 0)
         print(f"  {status.value:15} {count:5}")
 
     # Account stats
-    from services.account_manager import AccountManager
-    am = AccountManager(db)
-    stats = am.get_all_stats()
+    stats = _cached(cache, "get_all_stats", lambda: get_account_manager().get_all_stats())
     print("\nAccounts:")
     print(f"  Total: {stats['total_accounts']}")
     for platform, counts in stats.get("by_platform", {}).items():
         print(f"  {platform}: {counts['active']} active, {counts['with_creds']} with credentials")
 
     # Upload queue
-    from services.upload_router import UploadRouter
-    router = UploadRouter(db, am)
-    upload_stats = router.get_upload_stats()
+    upload_stats = _cached(cache, "get_upload_stats", get_upload_stats)
     print("\nUpload Queue:")
     print(f"  Pending:   {upload_stats['pending']}")
     print(f"  Uploading: {upload_stats['uploading']}")
@@ -296,6 +369,9 @@ def show_status():
 
     print("\n" + "=" * 60 + "\n")
 
+    if not fresh:
+        _save_status_cache(cache)
+
 
 if __name__ == "__main__":
     sys.exit(main())
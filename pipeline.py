@@ -4,9 +4,11 @@ Coordinates all services to run the full pipeline.
 """
 
 import logging
+import os
+from functools import cached_property
 from typing import Optional, Tuple, List
 
-from core.database import Database
+from core.database import Database, get_database
 from core.models import Compilation, CompilationStatus
 from config.settings import settings
 
@@ -28,58 +30,38 @@ class Pipeline:
         """Initialize pipeline with database connection."""
         settings.ensure_directories()
 
-        self.db = db or Database(settings.DATABASE_PATH)
+        self.db = db or get_database(settings.DATABASE_PATH)
 
-        # Lazy-load services
-        self._discovery = None
-        self._downloader = None
-        self._classifier = None
-        self._grouper = None
-        self._captioner = None
-        self._stitcher = None
-        self._uploader = None
+    # Services are created on first use; cached_property then stores them on
+    # the instance, so later accesses are plain attribute reads
 
-    @property
+    @cached_property
     def discovery(self) -> DiscoveryService:
-        if self._discovery is None:
-            self._discovery = DiscoveryService(self.db)
-        return self._discovery
+        return DiscoveryService(self.db)
 
-    @property
+    @cached_property
     def downloader(self) -> DownloaderService:
-        if self._downloader is None:
-            self._downloader = DownloaderService(self.db)
-        return self._downloader
+        return DownloaderService(self.db)
 
-    @property
+    @cached_property
     def classifier(self) -> ClassifierService:
-        if self._classifier is None:
-            self._classifier = ClassifierService(self.db)
-        return self._classifier
+        return ClassifierService(self.db)
 
-    @property
+    @cached_property
     def grouper(self) -> GrouperService:
-        if self._grouper is None:
-            self._grouper = GrouperService(self.db)
-        return self._grouper
+        return GrouperService(self.db)
 
-    @property
+    @cached_property
     def captioner(self) -> CaptionerService:
-        if self._captioner is None:
-            self._captioner = CaptionerService(self.db)
-        return self._captioner
+        return CaptionerService(self.db)
 
-    @property
+    @cached_property
     def stitcher(self) -> StitcherService:
-        if self._stitcher is None:
-            self._stitcher = StitcherService(self.db)
-        return self._stitcher
+        return StitcherService(self.db)
 
-    @property
+    @cached_property
     def uploader(self) -> UploaderService:
-        if self._uploader is None:
-            self._uploader = UploaderService(self.db)
-        return self._uploader
+        return UploaderService(self.db)
 
     def discover(
         self,
@@ -301,7 +283,6 @@ class Pipeline:
         self.db.update_compilation(compilation)
 
         if delete_file and compilation.output_path:
-            import os
             try:
                 os.remove(compilation.output_path)
                 logger.info(f"Deleted output file: {compilation.output_path}")
@@ -311,6 +292,48 @@ class Pipeline:
         logger.info(f"Rejected compilation {compilation_id}")
         return True
 
+    def reject_batch(self, compilation_ids: List[str], delete_files: bool = True) -> int:
+        """
+        Reject many compilations with a single status update.
+        Compilations that are missing or not in REVIEW/APPROVED are skipped.
+        Returns the number rejected.
+        """
+        compilations = self.db.get_compilations_by_ids(compilation_ids)
+        rejectable = []
+        for compilation_id in dict.fromkeys(compilation_ids):
+            compilation = compilations.get(compilation_id)
+            if not compilation:
+                logger.warning(f"Compilation {compilation_id} not found")
+            elif compilation.status not in (
+                CompilationStatus.REVIEW,
+                CompilationStatus.APPROVED,
+            ):
+                logger.warning(
+                    f"Can only reject compilations in REVIEW or APPROVED status "
+                    f"(current: {compilation.status})"
+                )
+            else:
+                rejectable.append(compilation)
+
+        if not rejectable:
+            return 0
+
+        self.db.update_compilation_statuses(
+            [c.id for c in rejectable], CompilationStatus.REJECTED
+        )
+
+        if delete_files:
+            for compilation in rejectable:
+                if compilation.output_path:
+                    try:
+                        os.remove(compilation.output_path)
+                        logger.info(f"Deleted output file: {compilation.output_path}")
+                    except OSError:
+                        pass
+
+        logger.info(f"Rejected {len(rejectable)} compilations")
+        return len(rejectable)
+
     def upload(
         self,
         compilation_id: str,
@@ -4,10 +4,13 @@ Coordinates the full flow from discovery to video composition.
 """
 
 import logging
+from contextlib import closing
+from functools import cached_property
+from itertools import islice
 from typing import List, Optional, Tuple
 
 from config.settings import settings
-from core.database import Database
+from core.database import Database, get_database
 from core.models import RedditPost, RedditVideo, RedditPostStatus, RedditVideoStatus
 from services.reddit_scraper import RedditScraperService
 from services.reddit_tts import RedditTTSService
@@ -21,39 +24,29 @@ class RedditPipeline:
 
     def __init__(self, db: Database = None):
         """Initialize pipeline with optional database."""
-        self._db = db
-        self._scraper = None
-        self._tts = None
-        self._composer = None
+        if db is not None:
+            self.db = db
 
-    @property
+    @cached_property
     def db(self) -> Database:
         """Lazy-load database connection."""
-        if self._db is None:
-            settings.ensure_directories()
-            self._db = Database(settings.DATABASE_PATH)
-        return self._db
+        settings.ensure_directories()
+        return get_database(settings.DATABASE_PATH)
 
-    @property
+    @cached_property
     def scraper(self) -> RedditScraperService:
         """Lazy-load scraper service."""
-        if self._scraper is None:
-            self._scraper = RedditScraperService(self.db)
-        return self._scraper
+        return RedditScraperService(self.db)
 
-    @property
+    @cached_property
     def tts(self) -> RedditTTSService:
         """Lazy-load TTS service."""
-        if self._tts is None:
-            self._tts = RedditTTSService(self.db)
-        return self._tts
+        return RedditTTSService(self.db)
 
-    @property
+    @cached_property
     def composer(self) -> RedditComposerService:
         """Lazy-load composer service."""
-        if self._composer is None:
-            self._composer = RedditComposerService(self.db)
-        return self._composer
+        return RedditComposerService(self.db)
 
     def discover(
         self,
@@ -225,12 +218,7 @@ class RedditPipeline:
                 logger.warning(f"Invalid status: {status}")
                 return []
         else:
-            # Return all posts (combine all statuses)
-            all_posts = []
-            for s in RedditPostStatus:
-                posts = self.db.get_reddit_posts_by_status(s, limit)
-                all_posts.extend(posts)
-            return all_posts[:limit]
+            return self.db.get_reddit_posts(limit)
 
     def list_videos(
         self,
@@ -254,4 +242,5 @@ class RedditPipeline:
                 logger.warning(f"Invalid status: {status}")
                 return []
         else:
-            return self.db.get_all_reddit_videos()[:limit]
+            with closing(self.db.iter_all_reddit_videos()) as videos:
+                return list(islice(videos, limit))
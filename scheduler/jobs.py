@@ -11,7 +11,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from core.database import Database
+from core.database import get_database
 from core.models import (
     VideoStatus, CompilationStatus, Platform, UploadStatus,
     Upload, Account, Compilation, ContentStrategy
@@ -35,8 +35,14 @@ class PipelineScheduler:
 
     def __init__(self, db_path: Optional[str] = None):
         """Initialize scheduler with database connection."""
-        self.db = Database(db_path or settings.DATABASE_PATH)
-        self.scheduler = BackgroundScheduler()
+        self.db = get_database(db_path or settings.DATABASE_PATH)
+        # A job that overruns its interval runs once when it frees up instead
+        # of replaying every missed run; no job ever overlaps itself
+        self.scheduler = BackgroundScheduler(job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": 60,
+        })
 
         # Initialize services
         self._discovery: Optional[DiscoveryService] = None
@@ -325,6 +331,13 @@ class PipelineScheduler:
         except Exception as e:
             logger.error(f"Retry failed uploads job failed: {e}")
 
+    def job_optimize_database(self) -> None:
+        """Refresh SQLite planner statistics."""
+        try:
+            self.db.optimize()
+        except Exception as e:
+            logger.error(f"Database optimize job failed: {e}")
+
     def job_full_pipeline(self) -> None:
         """
         Run the full pipeline in sequence.
@@ -503,7 +516,16 @@ class PipelineScheduler:
             replace_existing=True,
         )
 
-        logger.info("Configured default schedule with 9 jobs")
+        # Optimize database: Every 15 minutes (keeps planner stats current)
+        self.scheduler.add_job(
+            self.job_optimize_database,
+            IntervalTrigger(minutes=15),
+            id="optimize_database",
+            name="Optimize database",
+            replace_existing=True,
+        )
+
+        logger.info("Configured default schedule with 10 jobs")
 
     def configure_aggressive_schedule(self) -> None:
         """
@@ -591,7 +613,16 @@ class PipelineScheduler:
             replace_existing=True,
         )
 
-        logger.info("Configured aggressive schedule with 9 jobs")
+        # Optimize database: Every 15 minutes (keeps planner stats current)
+        self.scheduler.add_job(
+            self.job_optimize_database,
+            IntervalTrigger(minutes=15),
+            id="optimize_database",
+            name="Optimize database",
+            replace_existing=True,
+        )
+
+        logger.info("Configured aggressive schedule with 10 jobs")
 
     def configure_mega_compilation_schedule(self) -> None:
         """
@@ -670,7 +701,16 @@ class PipelineScheduler:
             replace_existing=True,
         )
 
-        logger.info("Configured mega-compilation schedule with 8 jobs")
+        # Optimize database: Every 15 minutes (keeps planner stats current)
+        self.scheduler.add_job(
+            self.job_optimize_database,
+            IntervalTrigger(minutes=15),
+            id="optimize_database",
+            name="Optimize database",
+            replace_existing=True,
+        )
+
+        logger.info("Configured mega-compilation schedule with 9 jobs")
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -11,7 +11,7 @@ from typing import Dict, List, Optional
 from core.database import Database
 from core.encryption import get_encryption
 from core.models import (
-    Account, Platform, ContentStrategy, RoutingRule
+    Account, Platform, ContentStrategy, RoutingRule, UploadStatus
 )
 
 logger = logging.getLogger(__name__)
@@ -370,8 +370,7 @@ class AccountManager:
         if not account:
             return None
 
-        uploads = self.db.get_uploads_for_account(account_id)
-        successful = [u for u in uploads if u.status.value == "success"]
+        upload_counts = self.db.count_uploads_for_account(account_id)
 
         return {
             "account_id": account_id,
@@ -381,8 +380,8 @@ class AccountManager:
             "is_active": account.is_active,
             "uploads_today": account.uploads_today,
             "daily_limit": account.daily_upload_limit,
-            "total_uploads": len(uploads),
-            "successful_uploads": len(successful),
+            "total_uploads": sum(upload_counts.values()),
+            "successful_uploads": upload_counts.get(UploadStatus.SUCCESS.value, 0),
             "last_upload": account.last_upload_at.isoformat() if account.last_upload_at else None,
             "has_credentials": bool(account.credentials_encrypted),
             "error": account.error or None,
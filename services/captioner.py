@@ -29,6 +29,10 @@ class CaptionerService:
         No per-clip captions, no end card.
         """
         videos = self.db.get_videos_for_compilation(compilation.id)
+        return self._build_captions(compilation, videos)
+
+    def _build_captions(self, compilation: Compilation, videos: List[Video]) -> dict:
+        """Build the countdown captions for a compilation's ordered videos."""
         num_clips = len(videos)
 
         if not videos:
@@ -63,7 +67,9 @@ class CaptionerService:
         Returns True on success.
         """
         try:
-            captions = self.generate_captions(compilation)
+            # Fetched once: the same videos are captioned below
+            videos = self.db.get_videos_for_compilation(compilation.id)
+            captions = self._build_captions(compilation, videos)
 
             # Update compilation
             compilation.hook = captions["hook"]
@@ -73,11 +79,11 @@ class CaptionerService:
 
             self.db.update_compilation(compilation)
 
-            # Update individual video captions
-            videos = self.db.get_videos_for_compilation(compilation.id)
-            for video, caption in zip(videos, captions["clip_captions"]):
-                video.caption = caption
-                self.db.update_video(video)
+            # Update individual video captions in one transaction
+            self.db.update_video_captions({
+                video.id: caption
+                for video, caption in zip(videos, captions["clip_captions"])
+            })
 
             logger.info(f"Updated captions for compilation {compilation.id}")
             return True
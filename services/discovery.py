@@ -127,18 +127,12 @@ class DiscoveryService:
 
         items = self._run_actor(run_input)
 
-        videos = []
-        skipped = 0
+        parsed = [self._parse_video_data(item) for item in items]
+        candidates = [video for video in parsed if video]
+        inserted = self.db.insert_videos_bulk(candidates)
 
-        for item in items:
-            video = self._parse_video_data(item)
-            if video:
-                if self.db.insert_video(video):
-                    videos.append(video)
-                else:
-                    skipped += 1
-            else:
-                skipped += 1
+        videos = [video for video, ok in zip(candidates, inserted) if ok]
+        skipped = len(items) - len(videos)
 
         logger.info(f"Discovered {len(videos)} new videos, skipped {skipped}")
         return videos, skipped
@@ -156,18 +150,12 @@ class DiscoveryService:
 
         items = self._run_actor(run_input)
 
-        videos = []
-        skipped = 0
+        parsed = [self._parse_video_data(item) for item in items]
+        candidates = [video for video in parsed if video]
+        inserted = self.db.insert_videos_bulk(candidates)
 
-        for item in items:
-            video = self._parse_video_data(item)
-            if video:
-                if self.db.insert_video(video):
-                    videos.append(video)
-                else:
-                    skipped += 1
-            else:
-                skipped += 1
+        videos = [video for video, ok in zip(candidates, inserted) if ok]
+        skipped = len(items) - len(videos)
 
         logger.info(f"Discovered {len(videos)} new trending videos, skipped {skipped}")
         return videos, skipped
@@ -6,6 +6,7 @@ import json
 import logging
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -173,20 +174,26 @@ class DownloaderService:
         self, videos: list[Video], progress_callback: Optional[callable] = None
     ) -> Tuple[int, int]:
         """
-        Download multiple videos.
+        Download multiple videos concurrently.
+        yt-dlp runs as a subprocess, so worker threads mostly wait on the
+        network; database writes still serialize on the single writer.
         Returns (success_count, fail_count).
         """
         success = 0
         fail = 0
-
-        for i, video in enumerate(videos):
-            if progress_callback:
-                progress_callback(i + 1, len(videos), video)
-
-            if self.download(video):
-                success += 1
-            else:
-                fail += 1
+        workers = max(1, min(settings.DOWNLOAD_WORKERS, len(videos)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.download, video): video for video in videos}
+            # Progress is reported from this thread as downloads finish
+            for i, future in enumerate(as_completed(futures)):
+                if progress_callback:
+                    progress_callback(i + 1, len(videos), futures[future])
+
+                if future.result():
+                    success += 1
+                else:
+                    fail += 1
 
         logger.info(f"Batch download complete: {success} succeeded, {fail} failed")
         return success, fail
@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
 
-from core.models import Video, Compilation, VideoStatus, CompilationStatus
+from core.models import Video, Compilation, VideoStatus, CompilationStatus, rank_videos
 from core.database import Database
 from config.settings import settings, categories_config
 
@@ -101,14 +101,15 @@ class GrouperService:
 
     def _get_next_part_number(self, category: str, subcategory: str = "") -> int:
         """Get the next part number for a category's compilations."""
-        compilations = self.db.get_compilations_by_status(CompilationStatus.UPLOADED)
-        compilations += self.db.get_compilations_by_status(CompilationStatus.APPROVED)
-        compilations += self.db.get_compilations_by_status(CompilationStatus.REVIEW)
-        compilations += self.db.get_compilations_by_status(CompilationStatus.PENDING)
-
-        # Count compilations with matching category (optionally subcategory in title)
-        category_count = sum(1 for c in compilations if c.category == category)
-        return category_count + 1
+        # Count compilations with matching category in SQL rather than
+        # loading every compilation just to compare its category
+        counts = self.db.count_compilations_by_category([
+            CompilationStatus.UPLOADED,
+            CompilationStatus.APPROVED,
+            CompilationStatus.REVIEW,
+            CompilationStatus.PENDING,
+        ])
+        return counts.get(category, 0) + 1
 
     def _filter_quality_videos(self, videos: List[Video]) -> List[Video]:
         """
@@ -196,14 +197,8 @@ class GrouperService:
         # Filter by quality thresholds
         quality_videos = self._filter_quality_videos(videos)
 
-        # Sort by likes descending
-        sorted_videos = sorted(
-            quality_videos,
-            key=lambda v: v.likes,
-            reverse=True
-        )
-
-        return sorted_videos[:num_clips]
+        # Top videos by likes, descending
+        return rank_videos(quality_videos, num_clips, key=lambda v: v.likes)
 
     def create_compilation_by_subcategory(
         self,
@@ -302,7 +297,9 @@ class GrouperService:
             video.compilation_id = compilation_id
             video.clip_order = order
             video.status = VideoStatus.GROUPED
-            self.db.update_video(video)
+        self.db.assign_videos_to_compilation(
+            compilation_id, [video.id for video in selected_videos]
+        )
 
         logger.info(
             f"Created {category}/{subcategory} compilation {compilation_id}: "
@@ -431,7 +428,9 @@ class GrouperService:
             video.compilation_id = compilation_id
             video.clip_order = order
             video.status = VideoStatus.GROUPED
-            self.db.update_video(video)
+        self.db.assign_videos_to_compilation(
+            compilation_id, [video.id for video in selected_videos]
+        )
 
         logger.info(
             f"Created mixed {category} compilation {compilation_id}: "
@@ -628,14 +627,8 @@ class GrouperService:
         else:
             num_sources = min(num_sources, len(source_comps))
 
-        # Sort by weighted score (engagement, quality, duration, recency)
-        sorted_sources = sorted(
-            source_comps,
-            key=self._calculate_source_score,
-            reverse=True
-        )
-
-        selected = sorted_sources[:num_sources]
+        # Top sources by weighted score (engagement, quality, duration, recency)
+        selected = rank_videos(source_comps, num_sources, key=self._calculate_source_score)
 
         # Calculate total duration
         total_duration = sum(v.duration or 0 for v in selected)
@@ -679,7 +672,9 @@ class GrouperService:
             video.compilation_id = compilation_id
             video.clip_order = order
             video.status = VideoStatus.GROUPED
-            self.db.update_video(video)
+        self.db.assign_videos_to_compilation(
+            compilation_id, [video.id for video in selected]
+        )
 
         logger.info(
             f"Created mega-compilation {compilation_id}: '{title}' "
@@ -229,12 +229,7 @@ class UploadRouter:
         limit: Optional[int] = None,
     ) -> List[Upload]:
         """Get pending uploads, optionally filtered by platform."""
-        pending = self.db.get_pending_uploads(limit)
-
-        if platform:
-            pending = [u for u in pending if u.platform == platform]
-
-        return pending
+        return self.db.get_pending_uploads(limit, platform=platform)
 
     def get_next_upload(self, platform: Platform) -> Optional[Tuple[Upload, Account, Compilation]]:
         """
@@ -324,10 +319,11 @@ class UploadRouter:
 
     def get_upload_stats(self) -> Dict:
         """Get upload queue statistics."""
-        pending = len(self.db.get_uploads_by_status(UploadStatus.PENDING))
-        uploading = len(self.db.get_uploads_by_status(UploadStatus.UPLOADING))
-        success = len(self.db.get_uploads_by_status(UploadStatus.SUCCESS))
-        failed = len(self.db.get_uploads_by_status(UploadStatus.FAILED))
+        counts = self.db.count_uploads_by_status()
+        pending = counts.get(UploadStatus.PENDING.value, 0)
+        uploading = counts.get(UploadStatus.UPLOADING.value, 0)
+        success = counts.get(UploadStatus.SUCCESS.value, 0)
+        failed = counts.get(UploadStatus.FAILED.value, 0)
 
         return {
             "pending": pending,
@@ -0,0 +1,118 @@
+"""
+Tests for the SQLite database layer.
+"""
+
+import copy
+import pickle
+
+from core.database import Database, get_database
+from core.models import Compilation, Platform, Upload, UploadStatus, Video
+
+
+def test_reset_database_forgets_cached_tiktok_ids(tmp_path):
+    """Videos deleted by a reset can be discovered and inserted again."""
+    db = Database(tmp_path / "pipeline.db")
+    assert db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1"))
+    assert db.tiktok_id_exists("t1")
+
+    db.reset_database()
+
+    assert not db.tiktok_id_exists("t1")
+    assert db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1"))
+    assert db.tiktok_id_exists("t1")
+
+
+def test_tiktok_id_deleted_by_another_instance_is_not_reported(tmp_path):
+    """A delete made through another Database (process) clears a cached hit."""
+    daemon_db = Database(tmp_path / "pipeline.db")
+    cli_db = Database(tmp_path / "pipeline.db")
+    assert daemon_db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1"))
+    assert daemon_db.tiktok_id_exists("t1")
+
+    cli_db.reset_database()
+
+    assert not daemon_db.tiktok_id_exists("t1")
+    assert daemon_db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1"))
+    assert daemon_db.tiktok_id_exists("t1")
+
+
+def test_loaded_video_copies_and_pickles_untracked(tmp_path):
+    """Copies of a loaded row hold its values but share no tracking state."""
+    db = Database(tmp_path / "pipeline.db")
+    db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1", hashtags=["fyp"]))
+    video = db.get_video("v1")
+
+    for clone in (copy.copy(video), copy.deepcopy(video), pickle.loads(pickle.dumps(video))):
+        assert clone == video
+        assert clone.dirty_fields is None
+
+
+def test_count_uploads_by_status(tmp_path):
+    """Upload counts come back keyed by status value."""
+    db = Database(tmp_path / "pipeline.db")
+    statuses = [UploadStatus.PENDING, UploadStatus.PENDING, UploadStatus.FAILED]
+    for i, status in enumerate(statuses):
+        db.insert_upload(Upload(
+            id=f"u{i}", compilation_id=f"c{i}", account_id="a1",
+            platform=Platform.YOUTUBE, status=status,
+        ))
+
+    assert db.count_uploads_by_status() == {"pending": 2, "failed": 1}
+
+
+def test_tagged_counts_bucket_by_tag(tmp_path):
+    """Totals stay scalars and grouped tags stay dicts whatever their keys."""
+    db = Database(tmp_path / "pipeline.db")
+    stats = db._tagged_counts(
+        """SELECT 'total', NULL, 3
+           UNION ALL SELECT 'by_status', 'pending', 2
+           UNION ALL SELECT 'by_status', NULL, 1
+           UNION ALL SELECT 'by_category', NULL, 4""",
+        (),
+        totals=["total"],
+    )
+
+    assert stats == {
+        "total": 3,
+        "by_status": {"pending": 2, "unknown": 1},
+        "by_category": {"unknown": 4},
+    }
+
+
+def test_get_database_shares_instance_per_file(tmp_path, monkeypatch):
+    """Every spelling of a database path maps to the same shared Database."""
+    monkeypatch.chdir(tmp_path)
+    db = get_database(tmp_path / "pipeline.db")
+
+    assert get_database(str(tmp_path / "pipeline.db")) is db
+    assert get_database("pipeline.db") is db
+    assert get_database(tmp_path / "sub" / ".." / "pipeline.db") is db
+
+
+def test_update_saves_lists_changed_in_place(tmp_path):
+    """Appending to a loaded list is written by update_* without reassignment."""
+    db = Database(tmp_path / "pipeline.db")
+    db.insert_video(Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1", hashtags=["fyp"]))
+    db.insert_compilation(Compilation(id="c1", category="fails", video_ids=["v1"]))
+
+    video = db.get_video("v1")
+    video.hashtags.append("fails")
+    db.update_video(video)
+    compilation = db.get_compilation("c1")
+    compilation.video_ids.append("v2")
+    db.update_compilation(compilation)
+
+    assert db.get_video("v1").hashtags == ["fyp", "fails"]
+    assert db.get_compilation("c1").video_ids == ["v1", "v2"]
+
+
+def test_inserted_video_saves_lists_changed_in_place(tmp_path):
+    """An object marked clean by insert still saves later in-place list changes."""
+    db = Database(tmp_path / "pipeline.db")
+    video = Video(id="v1", url="https://tiktok.com/v1", tiktok_id="t1", hashtags=["fyp"])
+    assert db.insert_videos_bulk([video]) == [True]
+
+    video.hashtags.append("fails")
+    db.update_video(video)
+
+    assert db.get_video("v1").hashtags == ["fyp", "fails"]